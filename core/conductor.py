@@ -71,6 +71,13 @@ class Conductor:
             target_fps=self.config.get("target_fps", 30)
         )
         
+        # Double buffering: the render loop fills the back buffer while the
+        # display thread pushes the front buffer to the matrix
+        self._front_buffer = None
+        self._frame_ready = threading.Event()
+        self._frame_consumed = threading.Event()
+        self._display_thread = None
+        
         # Control flags
         self.running = False
         self._paused = False
@@ -210,31 +217,66 @@ class Conductor:
         self.running = True
         logger.info("Starting animation loop")
         
-        # Get frame buffer from pool
-        pixels = [(0, 0, 0)] * self.matrix.num_pixels
+        # Two frame buffers from the pool, reused for every frame. The pool
+        # was sized from the config before the driver existed; resize it if
+        # the driver reports a different pixel count
+        if self._frame_pool.pixels != self.matrix.num_pixels:
+            self._frame_pool = FrameBufferPool(
+                size=self.config.get("performance.buffer_pool_size", 3),
+                pixels=self.matrix.num_pixels
+            )
+        pool = self._frame_pool
+        front = pool.acquire()
+        back = pool.acquire()
+        
+        self._front_buffer = front
+        self._frame_ready.clear()
+        self._frame_consumed.set()
+        self._display_thread = threading.Thread(
+            target=self._display_loop, daemon=True
+        )
+        self._display_thread.start()
+        
+        # Pin only the render thread; the display thread is already running
+        self._tune_render_thread()
+        
+        # Bind per-frame collaborators once instead of resolving them
+        # through attribute chains on every iteration
+        config = self.config
+        frame_start = self.performance.frame_start
+        frame_end = self.performance.frame_end
+        limit = self._frame_limiter.limit
         
         while self.running:
             try:
                 # Start frame timing
-                self.performance.frame_start()
+                frame_start()
                 
-                if not self._paused and self.current_animation:
+                # Read the current program once so a concurrent
+                # set_animation() cannot swap it mid-frame
+                animation = self.current_animation
+                if not self._paused and animation:
+                    # Animations may build on the previous frame
+                    back[:] = front
+                    
                     # Run animation
-                    self.current_animation.animate(
-                        pixels,
-                        self.config,
-                        self.current_animation.frame_count
-                    )
-                    self.current_animation.frame_count += 1
+                    animation.animate(back, config, animation.frame_count)
+                    animation.frame_count += 1
                     
-                    # Update matrix
-                    self.matrix.update(pixels)
+                    # Hand the frame to the display thread once it has
+                    # finished pushing the previous one
+                    while self.running and not self._frame_consumed.wait(0.1):
+                        pass
+                    self._frame_consumed.clear()
+                    front, back = back, front
+                    self._front_buffer = front
+                    self._frame_ready.set()
                 
                 # Frame rate limiting
-                self._frame_limiter.limit()
+                limit()
                 
                 # Update performance metrics
-                self.performance.frame_end()
+                frame_end()
                 
                 # Process hardware events
                 if self.hardware:
@@ -246,8 +288,53 @@ class Conductor:
                 logger.error(f"Animation error: {e}")
                 time.sleep(0.1)  # Prevent tight error loop
         
+        self._display_thread.join(timeout=1.0)
+        pool.release(front)
+        pool.release(back)
         logger.info("Animation loop stopped")
     
+    def _tune_render_thread(self):
+        """Pin the calling thread to the render CPUs and raise its priority.
+        
+        Reduces scheduling jitter on the Pi. Requires Linux and, for the
+        real-time priority, CAP_SYS_NICE; failures are logged and ignored.
+        """
+        cpus = self.config.get("performance.render_cpus")
+        if cpus is None:
+            cpus = [2] if self.config.get("matrix_type") == "hub75" else [3]
+        if cpus and hasattr(os, "sched_setaffinity"):
+            try:
+                # Check against every CPU, not the inherited mask: isolated
+                # cores are left out of the default affinity on purpose
+                cpus = set(cpus) & set(range(os.cpu_count() or 1))
+                if cpus:
+                    os.sched_setaffinity(0, cpus)
+                    logger.info(f"Render thread pinned to CPUs {sorted(cpus)}")
+            except OSError as e:
+                logger.warning(f"Could not set render CPU affinity: {e}")
+        
+        priority = self.config.get("performance.render_priority", 0)
+        if priority and hasattr(os, "sched_setscheduler"):
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+                logger.info(f"Render thread using SCHED_FIFO priority {priority}")
+            except OSError as e:
+                logger.warning(f"Could not set render thread priority: {e}")
+    
+    def _display_loop(self):
+        """Push completed frames to the matrix as they become ready."""
+        while self.running:
+            if not self._frame_ready.wait(0.1):
+                continue
+            self._frame_ready.clear()
+            
+            try:
+                self.matrix.update(self._front_buffer)
+            except Exception as e:
+                logger.error(f"Display error: {e}")
+            finally:
+                self._frame_consumed.set()
+    
     def pause(self):
         """Pause animation."""
         self._paused = True
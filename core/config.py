@@ -3,17 +3,77 @@ Unified configuration management with performance optimizations.
 Consolidates the best features from all config implementations.
 """
 
+import copy
 import json
 import os
+import platform
 import time
+import queue
 import threading
 from typing import Dict, List, Tuple, Optional, Any
 from pathlib import Path
 import logging
 from functools import lru_cache
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
+# Resolution of the pure-hue lookup table used by hsv_to_rgb_array()
+HUE_LUT_SIZE = 1024
+
+
+def _build_hue_lut(size: int = HUE_LUT_SIZE) -> "np.ndarray":
+    """Pre-calculate fully saturated RGB (0.0-1.0) for each hue step."""
+    h6 = np.arange(size, dtype=np.float64)[:, None] * 6 / size
+    # Branchless form: channel n is 1 - clip(min(k, 4 - k), 0, 1), k = (n + 6h) % 6
+    k = (np.array([5, 3, 1]) + h6) % 6
+    return (1 - np.clip(np.minimum(k, 4 - k), 0, 1)).astype(np.float32)
+
+
+_HUE_LUT = _build_hue_lut() if HAS_NUMPY else None
+
+
+@lru_cache(maxsize=256)
+def _key_parts(key: str) -> Tuple[str, ...]:
+    """Split a dotted config key once; get() sees the same few keys every frame."""
+    return tuple(key.split('.'))
+
+
+def _dump_config(data: Dict[str, Any]) -> bytes:
+    """Encode a config mapping as indented UTF-8 JSON (orjson when installed)."""
+    if HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _load_config_bytes(data: bytes) -> Any:
+    """Decode JSON read from a config or preset file."""
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+@lru_cache(maxsize=1)
+def _pi_model() -> str:
+    """Read the board model from the device tree once per process.
+    
+    Unlike the cpuinfo Hardware field (BCM2835 on every Pi running the
+    downstream kernel), the model string names the actual board.
+    """
+    try:
+        return Path('/proc/device-tree/model').read_bytes().rstrip(b'\0').decode('ascii', 'replace')
+    except OSError:
+        return ''
+
 
 class ConfigManager:
     """Centralized configuration with caching and performance optimizations."""
@@ -62,10 +122,54 @@ class ConfigManager:
             "cache_size": 1000,
             "buffer_pool_size": 3,
             "stats_interval": 10,
-            "enable_profiling": False
+            "enable_profiling": False,
+            # Render thread placement on the Pi; None picks by matrix type.
+            # Core 3 is isolated (isolcpus=3): HUB75 leaves it to the
+            # rgbmatrix refresh thread and renders on core 2, WS2811 has no
+            # refresh thread and renders on the isolated core itself
+            "render_cpus": None,
+            "render_priority": 10,  # SCHED_FIFO priority (needs CAP_SYS_NICE), 0 to disable
+            "web_cpus": [0, 1]  # Flask/Socket.IO threads stay off cores 2-3
         }
     }
     
+    # Predefined palettes, built once rather than on every get_palette() call
+    PALETTES = {
+        "rainbow": [
+            (255, 0, 0),    # Red
+            (255, 127, 0),  # Orange
+            (255, 255, 0),  # Yellow
+            (0, 255, 0),    # Green
+            (0, 0, 255),    # Blue
+            (75, 0, 130),   # Indigo
+            (148, 0, 211)   # Violet
+        ],
+        "fire": [
+            (0, 0, 0),      # Black
+            (128, 0, 0),    # Dark red
+            (255, 0, 0),    # Red
+            (255, 128, 0),  # Orange
+            (255, 255, 0),  # Yellow
+            (255, 255, 128) # Light yellow
+        ],
+        "ocean": [
+            (0, 0, 64),     # Dark blue
+            (0, 0, 128),    # Medium blue
+            (0, 64, 255),   # Light blue
+            (0, 128, 255),  # Cyan blue
+            (64, 192, 255), # Light cyan
+            (128, 255, 255) # Very light cyan
+        ],
+        "forest": [
+            (0, 32, 0),     # Dark green
+            (0, 64, 0),     # Forest green
+            (0, 128, 0),    # Green
+            (64, 192, 0),   # Light green
+            (128, 255, 0),  # Yellow green
+            (192, 255, 64)  # Light yellow green
+        ]
+    }
+    
     def __init__(self, config_path: str = "settings.json"):
         self.config_path = config_path
         self._config = self._load_config()
@@ -75,6 +179,9 @@ class ConfigManager:
         # Performance optimizations
         self._gamma_table = self._build_gamma_table()
         self._serpentine_map = self._build_serpentine_map()
+        self._gamma_array = None  # NumPy view of the gamma table, built lazily
+        self._index_cache = {}  # (width, height) -> index array
+        self._geometry = self._build_geometry()
         self._color_cache = {}  # LRU cache for color conversions
         self._cache_size = self._config.get("performance", {}).get("cache_size", 1000)
         
@@ -82,6 +189,12 @@ class ConfigManager:
         self._save_timer = None
         self._save_delay = 5.0  # seconds
         
+        # Presets are written by a background thread; until a write lands
+        # the serialized preset stays here so it can be listed and loaded
+        self._pending_presets = {}  # name -> encoded JSON
+        self._preset_queue = queue.Queue()
+        self._preset_writer = None
+        
         # Platform detection
         self._platform = self._detect_platform()
         self._apply_platform_defaults()
@@ -92,6 +205,14 @@ class ConfigManager:
         if os.environ.get('LIGHTBOX_SIMULATION') == '1':
             return 'simulation'
             
+        model = _pi_model()
+        if 'Zero' in model:
+            return 'pi_zero_w'
+        elif 'Pi 3' in model:
+            return 'pi_3b_plus'
+        elif 'Pi 4' in model:
+            return 'pi_4'
+            
         try:
             with open('/proc/cpuinfo', 'r') as f:
                 cpuinfo = f.read()
@@ -103,7 +224,6 @@ class ConfigManager:
                     return 'pi_4'
         except FileNotFoundError:
             # Not on Linux or no cpuinfo
-            import platform
             system = platform.system()
             if system == 'Darwin':
                 return 'macos_simulation'
@@ -151,10 +271,9 @@ class ConfigManager:
         
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    loaded = json.load(f)
-                    # Deep merge loaded config with defaults
-                    self._deep_merge(config, loaded)
+                loaded = _load_config_bytes(Path(self.config_path).read_bytes())
+                # Deep merge loaded config with defaults
+                self._deep_merge(config, loaded)
                 logger.info(f"Loaded configuration from {self.config_path}")
         except Exception as e:
             logger.error(f"Error loading config: {e}, using defaults")
@@ -205,14 +324,19 @@ class ConfigManager:
                 
         return mapping
     
+    def _build_geometry(self) -> Tuple[int, int]:
+        """Resolve the active matrix (width, height) once."""
+        if self._config["matrix_type"] == "ws2811":
+            return (self._config["ws2811"]["width"], self._config["ws2811"]["height"])
+        return (self._config["hub75"]["cols"], self._config["hub75"]["rows"])
+    
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value with thread safety."""
         with self._lock:
             # Handle nested keys with dot notation
             if '.' in key:
-                parts = key.split('.')
                 value = self._config
-                for part in parts:
+                for part in _key_parts(key):
                     if isinstance(value, dict) and part in value:
                         value = value[part]
                     else:
@@ -225,13 +349,11 @@ class ConfigManager:
         with self._lock:
             # Handle nested keys
             if '.' in key:
-                parts = key.split('.')
+                *sections, name = _key_parts(key)
                 target = self._config
-                for part in parts[:-1]:
-                    if part not in target:
-                        target[part] = {}
-                    target = target[part]
-                target[parts[-1]] = value
+                for part in sections:
+                    target = target.setdefault(part, {})
+                target[name] = value
             else:
                 self._config[key] = value
                 
@@ -243,8 +365,42 @@ class ConfigManager:
         # Rebuild lookup tables if needed
         if key.startswith("ws2811.gamma"):
             self._gamma_table = self._build_gamma_table()
+            self._gamma_array = None
         elif key.startswith("ws2811.") and any(k in key for k in ["width", "height", "serpentine"]):
             self._serpentine_map = self._build_serpentine_map()
+            self._index_cache.clear()
+        elif key == "matrix_type" or key.startswith("hub75.cols"):
+            self._index_cache.clear()
+        
+        if key == "matrix_type" or key in ("hub75.cols", "hub75.rows", "ws2811.width", "ws2811.height"):
+            self._geometry = self._build_geometry()
+    
+    def snapshot(self, section: str) -> Dict[str, Any]:
+        """Copy of one config section, taken in a single locked lookup.
+        
+        Use this instead of several dotted get() calls when a caller needs
+        many keys of a section, or hands the section to another thread.
+        """
+        with self._lock:
+            return copy.deepcopy(self._config.get(section, {}))
+    
+    def update_section(self, section: str, values: Dict[str, Any]):
+        """Merge several settings into one config section in a single update."""
+        with self._lock:
+            self._deep_merge(self._config.setdefault(section, {}), values)
+            self._dirty = True
+        
+        self._schedule_save()
+        if section in ("ws2811", "hub75"):
+            self._rebuild_tables()
+    
+    def _rebuild_tables(self):
+        """Rebuild lookup tables after a bulk configuration change."""
+        self._gamma_table = self._build_gamma_table()
+        self._serpentine_map = self._build_serpentine_map()
+        self._gamma_array = None
+        self._index_cache.clear()
+        self._geometry = self._build_geometry()
     
     def _schedule_save(self):
         """Schedule a debounced configuration save."""
@@ -269,8 +425,8 @@ class ConfigManager:
                 
                 # Write to temp file first
                 temp_path = f"{self.config_path}.tmp"
-                with open(temp_path, 'w') as f:
-                    json.dump(self._config, f, indent=2)
+                with open(temp_path, 'wb') as f:
+                    f.write(_dump_config(self._config))
                 
                 # Atomic rename
                 os.replace(temp_path, self.config_path)
@@ -290,6 +446,18 @@ class ConfigManager:
             width = self._config["hub75"]["cols"]
             return y * width + x
     
+    def pixel_indices(self, width: int, height: int) -> "np.ndarray":
+        """Get a (height, width) array of xy_to_index() results (requires NumPy)."""
+        key = (width, height)
+        indices = self._index_cache.get(key)
+        if indices is None:
+            indices = np.array(
+                [[self.xy_to_index(x, y) for x in range(width)] for y in range(height)],
+                dtype=np.intp
+            )
+            self._index_cache[key] = indices
+        return indices
+    
     def gamma_correct(self, value: int, color_index: int = 0) -> int:
         """Apply gamma correction using lookup table (fast)."""
         if 0 <= value <= 255:
@@ -304,107 +472,154 @@ class ConfigManager:
         s = max(0.0, min(1.0, s))
         v = max(0.0, min(1.0, v))
         
-        # Fast HSV to RGB conversion
+        # Branchless HSV to RGB: channel n = v - v*s*clip(min(k, 4-k), 0, 1)
+        # with k = (n + 6h) % 6 and n = 5, 3, 1 for r, g, b
+        h6 = h * 6
         c = v * s
-        x = c * (1 - abs((h * 6) % 2 - 1))
-        m = v - c
-        
-        if h < 1/6:
-            r, g, b = c, x, 0
-        elif h < 2/6:
-            r, g, b = x, c, 0
-        elif h < 3/6:
-            r, g, b = 0, c, x
-        elif h < 4/6:
-            r, g, b = 0, x, c
-        elif h < 5/6:
-            r, g, b = x, 0, c
-        else:
-            r, g, b = c, 0, x
+        kr = (5 + h6) % 6
+        kg = (3 + h6) % 6
+        kb = (1 + h6) % 6
+        r = v - c * max(0.0, min(kr, 4 - kr, 1.0))
+        g = v - c * max(0.0, min(kg, 4 - kg, 1.0))
+        b = v - c * max(0.0, min(kb, 4 - kb, 1.0))
             
         # Convert to 8-bit with gamma correction
-        r = self.gamma_correct(int((r + m) * 255))
-        g = self.gamma_correct(int((g + m) * 255))
-        b = self.gamma_correct(int((b + m) * 255))
+        r = self.gamma_correct(int(r * 255))
+        g = self.gamma_correct(int(g * 255))
+        b = self.gamma_correct(int(b * 255))
         
         return (r, g, b)
     
+    def gamma_correct_array(self, values: "np.ndarray") -> "np.ndarray":
+        """Apply gamma correction to an array of 0-255 values (requires NumPy)."""
+        if self._gamma_array is None:
+            self._gamma_array = np.asarray(self._gamma_table, dtype=np.uint8)
+        if values.dtype == np.uint8:
+            # Already in range: index the 256-entry table directly
+            return self._gamma_array[values]
+        return self._gamma_array[np.clip(values, 0, 255).astype(np.intp)]
+    
+    def hsv_to_rgb_array(self, h, s, v) -> "np.ndarray":
+        """Vectorized hsv_to_rgb() for NumPy arrays, returns (..., 3) uint8."""
+        # Normalize inputs
+        h = np.mod(h, 1.0)
+        s = np.clip(s, 0.0, 1.0)[..., None]
+        v = np.clip(v, 0.0, 1.0)[..., None]
+        
+        # Hue lookup replaces the six-way sector branch: channel = m + c * pure
+        pure = _HUE_LUT[(h * HUE_LUT_SIZE).astype(np.intp) % HUE_LUT_SIZE]
+        rgb = v * (1 - s) + (v * s) * pure
+        # Clamp in place so the uint8 cast can never wrap around
+        np.clip(rgb, 0.0, 1.0, out=rgb)
+        return self.gamma_correct_array((rgb * 255).astype(np.uint8))
+    
     def get_palette(self, name: str = None) -> List[Tuple[int, int, int]]:
         """Get color palette by name."""
         if name is None:
             name = self._config.get("color_palette", "rainbow")
             
-        # Predefined palettes
-        palettes = {
-            "rainbow": [
-                (255, 0, 0),    # Red
-                (255, 127, 0),  # Orange
-                (255, 255, 0),  # Yellow
-                (0, 255, 0),    # Green
-                (0, 0, 255),    # Blue
-                (75, 0, 130),   # Indigo
-                (148, 0, 211)   # Violet
-            ],
-            "fire": [
-                (0, 0, 0),      # Black
-                (128, 0, 0),    # Dark red
-                (255, 0, 0),    # Red
-                (255, 128, 0),  # Orange
-                (255, 255, 0),  # Yellow
-                (255, 255, 128) # Light yellow
-            ],
-            "ocean": [
-                (0, 0, 64),     # Dark blue
-                (0, 0, 128),    # Medium blue
-                (0, 64, 255),   # Light blue
-                (0, 128, 255),  # Cyan blue
-                (64, 192, 255), # Light cyan
-                (128, 255, 255) # Very light cyan
-            ],
-            "forest": [
-                (0, 32, 0),     # Dark green
-                (0, 64, 0),     # Forest green
-                (0, 128, 0),    # Green
-                (64, 192, 0),   # Light green
-                (128, 255, 0),  # Yellow green
-                (192, 255, 64)  # Light yellow green
-            ]
-        }
-        
-        return palettes.get(name, palettes["rainbow"])
+        return list(self.PALETTES.get(name, self.PALETTES["rainbow"]))
     
     def save_preset(self, name: str):
-        """Save current configuration as a preset."""
+        """Save current configuration as a preset.
+        
+        The configuration is serialized immediately; the file is written by a
+        background thread so the caller does not wait on the SD card.
+        """
+        with self._lock:
+            self._pending_presets[name] = _dump_config(self._config)
+            if self._preset_writer is None:
+                self._preset_writer = threading.Thread(
+                    target=self._write_presets,
+                    name="PresetWriter",
+                    daemon=True
+                )
+                self._preset_writer.start()
+        
+        self._preset_queue.put(name)
+    
+    def _write_presets(self):
+        """Write queued presets to disk until cleanup() sends None."""
         preset_dir = "presets"
-        os.makedirs(preset_dir, exist_ok=True)
         
-        preset_path = os.path.join(preset_dir, f"{name}.json")
-        with open(preset_path, 'w') as f:
-            json.dump(self._config, f, indent=2)
+        while True:
+            name = self._preset_queue.get()
+            if name is None:
+                break
+            
+            with self._lock:
+                text = self._pending_presets.get(name)
+            if text is None:
+                continue  # Already written by an earlier queue entry
             
-        logger.info(f"Saved preset: {name}")
+            preset_path = os.path.join(preset_dir, f"{name}.json")
+            temp_path = f"{preset_path}.tmp"
+            try:
+                os.makedirs(preset_dir, exist_ok=True)
+                with open(temp_path, 'wb') as f:
+                    f.write(text)
+                
+                with self._lock:
+                    # Publish only if this save is still current: a newer save
+                    # stays pending for its own entry, and delete_preset() may
+                    # have dropped the preset while the temp file was written
+                    current = self._pending_presets.get(name) is text
+                    if current:
+                        os.replace(temp_path, preset_path)
+                        del self._pending_presets[name]
+                if current:
+                    logger.info(f"Saved preset: {name}")
+                else:
+                    os.remove(temp_path)
+            except Exception as e:
+                logger.error(f"Error saving preset {name}: {e}")
+                with self._lock:
+                    if self._pending_presets.get(name) is text:
+                        del self._pending_presets[name]
+    
+    def list_presets(self) -> List[str]:
+        """Names of saved presets, including ones still being written."""
+        preset_dir = Path("presets")
+        names = {path.stem for path in preset_dir.glob("*.json")} if preset_dir.exists() else set()
+        with self._lock:
+            names.update(self._pending_presets)
+        return sorted(names)
+    
+    def delete_preset(self, name: str) -> bool:
+        """Delete a preset. Returns False if it does not exist."""
+        with self._lock:
+            pending = self._pending_presets.pop(name, None) is not None
+        
+        preset_path = Path("presets") / f"{name}.json"
+        if preset_path.exists():
+            preset_path.unlink()
+            return True
+        return pending
     
     def load_preset(self, name: str) -> bool:
         """Load configuration from a preset."""
+        with self._lock:
+            text = self._pending_presets.get(name)
+        
         preset_path = os.path.join("presets", f"{name}.json")
         
-        if not os.path.exists(preset_path):
+        if text is None and not os.path.exists(preset_path):
             logger.error(f"Preset not found: {name}")
             return False
             
         try:
-            with open(preset_path, 'r') as f:
-                preset = json.load(f)
+            if text is None:
+                with open(preset_path, 'rb') as f:
+                    text = f.read()
+            preset = _load_config_bytes(text)
+            with self._lock:
                 self._deep_merge(self._config, preset)
                 self._dirty = True
-                self._schedule_save()
-                
-                # Rebuild lookup tables
-                self._gamma_table = self._build_gamma_table()
-                self._serpentine_map = self._build_serpentine_map()
-                
-                logger.info(f"Loaded preset: {name}")
-                return True
+            self._schedule_save()
+            self._rebuild_tables()
+            
+            logger.info(f"Loaded preset: {name}")
+            return True
                 
         except Exception as e:
             logger.error(f"Error loading preset {name}: {e}")
@@ -425,6 +640,27 @@ class ConfigManager:
         """Check if platform supports HUB75 (Pi 3B+ or better)."""
         return self._platform in ['pi_3b_plus', 'pi_4']
     
+    # Cached geometry for animation scripts (fixed unless the matrix config changes)
+    @property
+    def matrix_width(self) -> int:
+        """Active matrix width in pixels."""
+        return self._geometry[0]
+    
+    @property
+    def matrix_height(self) -> int:
+        """Active matrix height in pixels."""
+        return self._geometry[1]
+    
+    @property
+    def brightness(self) -> float:
+        """Current global brightness (attribute-style access for scripts)."""
+        return self._config.get("brightness", 0.8)
+    
+    @property
+    def speed(self) -> float:
+        """Current animation speed (attribute-style access for scripts)."""
+        return self._config.get("speed", 1.0)
+    
     # Compatibility properties for old animation syntax
     @property
     def MATRIX_WIDTH(self) -> int:
@@ -474,4 +710,10 @@ class ConfigManager:
         """Clean up resources."""
         if self._save_timer:
             self._save_timer.cancel()
-        self._save_config()  # Final save
\ No newline at end of file
+        self._save_config()  # Final save
+        
+        # Let queued preset writes finish
+        if self._preset_writer:
+            self._preset_queue.put(None)
+            self._preset_writer.join(timeout=5.0)
+            self._preset_writer = None
\ No newline at end of file
@@ -16,15 +16,18 @@ Matrix HAT running on a Raspberry Pi 3B+.
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Any, Dict, TYPE_CHECKING
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class HardwareConfig:
-    """Strongly-typed container for HUB75 driver options."""
+    """Strongly-typed container for HUB75 driver options.
+
+    Frozen: built once from the config and shared read-only by the drivers.
+    """
 
     # Matrix geometry
     rows: int = 64
@@ -80,28 +83,31 @@ class HardwareConfig:
         logger.debug(
             "Building HardwareConfig from mapping: %s", hub_cfg
         )
+        # slots=True turns class attributes into member descriptors, so the
+        # declared defaults have to come from the dataclass fields
+        defaults = {f.name: f.default for f in fields(cls)}
         return cls(
-            rows=int(hub_cfg.get("rows", cls.rows)),
-            cols=int(hub_cfg.get("cols", cls.cols)),
-            chain_length=int(hub_cfg.get("chain_length", cls.chain_length)),
-            parallel=int(hub_cfg.get("parallel", cls.parallel)),
-            pwm_bits=int(hub_cfg.get("pwm_bits", cls.pwm_bits)),
+            rows=int(hub_cfg.get("rows", defaults["rows"])),
+            cols=int(hub_cfg.get("cols", defaults["cols"])),
+            chain_length=int(hub_cfg.get("chain_length", defaults["chain_length"])),
+            parallel=int(hub_cfg.get("parallel", defaults["parallel"])),
+            pwm_bits=int(hub_cfg.get("pwm_bits", defaults["pwm_bits"])),
             pwm_lsb_nanoseconds=int(
-                hub_cfg.get("pwm_lsb_nanoseconds", cls.pwm_lsb_nanoseconds)
+                hub_cfg.get("pwm_lsb_nanoseconds", defaults["pwm_lsb_nanoseconds"])
             ),
-            gpio_slowdown=int(hub_cfg.get("gpio_slowdown", cls.gpio_slowdown)),
-            limit_refresh=int(hub_cfg.get("limit_refresh", cls.limit_refresh)),
-            hardware_pwm=str(hub_cfg.get("hardware_pwm", cls.hardware_pwm)),
-            scan_mode=int(hub_cfg.get("scan_mode", cls.scan_mode)),
+            gpio_slowdown=int(hub_cfg.get("gpio_slowdown", defaults["gpio_slowdown"])),
+            limit_refresh=int(hub_cfg.get("limit_refresh", defaults["limit_refresh"])),
+            hardware_pwm=str(hub_cfg.get("hardware_pwm", defaults["hardware_pwm"])),
+            scan_mode=int(hub_cfg.get("scan_mode", defaults["scan_mode"])),
             row_address_type=int(
-                hub_cfg.get("row_address_type", cls.row_address_type)
+                hub_cfg.get("row_address_type", defaults["row_address_type"])
             ),
-            multiplexing=int(hub_cfg.get("multiplexing", cls.multiplexing)),
+            multiplexing=int(hub_cfg.get("multiplexing", defaults["multiplexing"])),
             cpu_isolation=bool(
-                hub_cfg.get("cpu_isolation", cls.cpu_isolation)
+                hub_cfg.get("cpu_isolation", defaults["cpu_isolation"])
             ),
             hardware_mapping=str(
-                hub_cfg.get("hardware_mapping", cls.hardware_mapping)
+                hub_cfg.get("hardware_mapping", defaults["hardware_mapping"])
             ),
         )
 
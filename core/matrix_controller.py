@@ -38,6 +38,12 @@ except ModuleNotFoundError:  # pragma: no cover – CI runners lack the module
         def Clear(self) -> None:  # noqa: D401 – simple stub verb
             """Pretend to clear the panel."""
 
+        def Fill(self, _r: int, _g: int, _b: int) -> None:  # noqa: D401
+            """Pretend to fill the panel."""
+
+        def SetImage(self, _image, _x: int = 0, _y: int = 0, unsafe: bool = True) -> None:  # noqa: D401
+            """Pretend to copy an image onto the panel."""
+
     class _SimMatrix(SimpleNamespace):
         width: int = 64
         height: int = 64
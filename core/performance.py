@@ -3,14 +3,22 @@ Performance monitoring and optimization utilities.
 Provides metrics collection with minimal overhead.
 """
 
+import sys
 import time
 import threading
 import json
 import os
 from collections import deque
+from math import sin, cos
 from typing import Dict, Optional, Any
 import logging
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 # Try to import psutil, but make it optional
 try:
     import psutil
@@ -80,8 +88,9 @@ class PerformanceMonitor:
     
     def __init__(self, stats_interval: float = 10.0):
         self.stats_interval = stats_interval
+        # FPS is derived from frame times when stats are read, so each
+        # frame only records one sample
         self.metrics = {
-            'fps': RollingAverage(30),
             'frame_time_ms': RollingAverage(30),
             'cpu_percent': RollingAverage(10),
             'memory_mb': RollingAverage(10),
@@ -90,7 +99,6 @@ class PerformanceMonitor:
         }
         
         # Frame timing
-        self._last_frame_time = time.perf_counter()
         self._frame_start_time = None
         
         # System metrics
@@ -116,25 +124,21 @@ class PerformanceMonitor:
         if self._frame_start_time is None:
             return
             
-        current_time = time.perf_counter()
-        frame_time = current_time - self._frame_start_time
+        frame_time = time.perf_counter() - self._frame_start_time
         
         # Update frame metrics
         self.metrics['frame_time_ms'].add(frame_time * 1000)
-        self.metrics['fps'].add(1.0 / frame_time if frame_time > 0 else 0)
         self.metrics['total_frames'] += 1
         
         # Check for dropped frames (>33ms for 30 FPS target)
         if frame_time > 0.033:
             self.metrics['dropped_frames'] += 1
         
-        self._last_frame_time = current_time
         self._frame_start_time = None
     
     def update(self, frame_time: float):
         """Update metrics with frame time (alternative to frame_start/end)."""
         self.metrics['frame_time_ms'].add(frame_time * 1000)
-        self.metrics['fps'].add(1.0 / frame_time if frame_time > 0 else 0)
         self.metrics['total_frames'] += 1
         
         # Check for dropped frames
@@ -178,14 +182,17 @@ class PerformanceMonitor:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get current performance statistics."""
+        current_ms = self.metrics['frame_time_ms'].current
+        average_ms = self.metrics['frame_time_ms'].average
         return {
             'fps': {
-                'current': self.metrics['fps'].current,
-                'average': self.metrics['fps'].average
+                'current': 1000.0 / current_ms if current_ms > 0 else 0.0,
+                # Frames over time for the window, not a mean of 1/frame_time
+                'average': 1000.0 / average_ms if average_ms > 0 else 0.0
             },
             'frame_time_ms': {
-                'current': self.metrics['frame_time_ms'].current,
-                'average': self.metrics['frame_time_ms'].average
+                'current': current_ms,
+                'average': average_ms
             },
             'cpu_percent': {
                 'current': self.metrics['cpu_percent'].current,
@@ -220,54 +227,77 @@ class PerformanceMonitor:
 
 
 class FrameRateLimiter:
-    """Precise frame rate limiting for consistent timing."""
+    """Precise frame rate limiting for consistent timing.
+    
+    Frames are paced against absolute deadlines (``next += period``) rather
+    than the time since the last frame, so render jitter does not accumulate
+    as drift. A frame that overruns its deadline resets the schedule instead
+    of bursting to catch up.
+    """
+    
+    # Python 3.11+ sleeps with clock_nanosleep() on Linux (a high-resolution
+    # timer elsewhere), precise enough that spinning out the last
+    # millisecond only burns CPU on the render core
+    _PRECISE_SLEEP = sys.version_info >= (3, 11)
     
     def __init__(self, target_fps: float):
         self.target_fps = target_fps
         self.target_frame_time = 1.0 / target_fps
-        self._last_frame_time = time.perf_counter()
+        self._next_frame_time = time.perf_counter()
         self._sleep_precision = 0.001  # 1ms precision
     
     def limit(self):
-        """Sleep to maintain target frame rate."""
-        current_time = time.perf_counter()
-        elapsed = current_time - self._last_frame_time
+        """Sleep until the next frame deadline."""
+        self._next_frame_time += self.target_frame_time
+        delay = self._next_frame_time - time.perf_counter()
         
-        if elapsed < self.target_frame_time:
-            # Calculate sleep time
-            sleep_time = self.target_frame_time - elapsed
-            
-            # Use precise sleeping for better accuracy
-            if sleep_time > self._sleep_precision:
-                time.sleep(sleep_time - self._sleep_precision)
+        if delay > 0:
+            if self._PRECISE_SLEEP:
+                time.sleep(delay)
+                return
             
-            # Busy wait for the remaining time
-            while time.perf_counter() - self._last_frame_time < self.target_frame_time:
+            # Older Pythons: sleep most of the way, then busy wait
+            if delay > self._sleep_precision:
+                time.sleep(delay - self._sleep_precision)
+            while time.perf_counter() < self._next_frame_time:
                 pass
-        
-        self._last_frame_time = time.perf_counter()
+        else:
+            # Behind schedule: skip catch-up and restart from now
+            self._next_frame_time = time.perf_counter()
     
     def reset(self):
         """Reset the frame timer."""
-        self._last_frame_time = time.perf_counter()
+        self._next_frame_time = time.perf_counter()
 
 
 class FrameBufferPool:
-    """Object pool for frame buffers to reduce allocations."""
+    """Object pool for frame buffers to reduce allocations.
+    
+    Buffers are (pixels, 3) uint8 arrays when NumPy is available, otherwise
+    lists of (r, g, b) tuples, so ``pixels[i] = (r, g, b)`` works in
+    animation scripts either way; every matrix driver accepts both.
+    """
     
     def __init__(self, size: int = 3, pixels: int = 4096):
         self._pool = deque(maxlen=size)
-        self._pixels = pixels
+        self.pixels = pixels
         self._lock = threading.Lock()
         
+        # Shared black frame, copied over list buffers on release (no per-call allocation)
+        self._zeros = [(0, 0, 0)] * pixels
+        
         # Pre-allocate buffers
         for _ in range(size):
-            buffer = bytearray(pixels * 3)  # RGB bytes
-            self._pool.append(buffer)
+            self._pool.append(self._new_buffer())
         
         logger.info(f"Frame buffer pool initialized with {size} buffers")
     
-    def acquire(self) -> bytearray:
+    def _new_buffer(self):
+        if HAS_NUMPY:
+            return np.zeros((self.pixels, 3), dtype=np.uint8)
+        return [(0, 0, 0)] * self.pixels
+    
+    def acquire(self):
         """Get a frame buffer from pool."""
         with self._lock:
             if self._pool:
@@ -275,13 +305,18 @@ class FrameBufferPool:
             else:
                 # Create new buffer if pool is empty
                 logger.warning("Frame buffer pool exhausted, creating new buffer")
-                return bytearray(self._pixels * 3)
+                return self._new_buffer()
     
-    def release(self, buffer: bytearray):
+    def release(self, buffer):
         """Return frame buffer to pool."""
         with self._lock:
             # Clear buffer before returning to pool
-            buffer[:] = b'\x00' * len(buffer)
+            if hasattr(buffer, 'fill'):
+                buffer.fill(0)
+            elif len(buffer) == len(self._zeros):
+                buffer[:] = self._zeros
+            else:
+                buffer[:] = [(0, 0, 0)] * len(buffer)
             
             if len(self._pool) < self._pool.maxlen:
                 self._pool.append(buffer)
@@ -298,8 +333,6 @@ class MathCache:
     
     def sin(self, angle: float) -> float:
         """Cached sine calculation."""
-        import math
-        
         # Round to precision for cache key
         key = round(angle, self._precision)
         
@@ -309,21 +342,19 @@ class MathCache:
                 # Remove oldest entry (simple FIFO)
                 self._sin_cache.pop(next(iter(self._sin_cache)))
             
-            self._sin_cache[key] = math.sin(angle)
+            self._sin_cache[key] = sin(angle)
         
         return self._sin_cache[key]
     
     def cos(self, angle: float) -> float:
         """Cached cosine calculation."""
-        import math
-        
         key = round(angle, self._precision)
         
         if key not in self._cos_cache:
             if len(self._cos_cache) >= self._cache_size:
                 self._cos_cache.pop(next(iter(self._cos_cache)))
             
-            self._cos_cache[key] = math.cos(angle)
+            self._cos_cache[key] = cos(angle)
         
         return self._cos_cache[key]
     
@@ -28,6 +28,7 @@ class HUB75ControllerDriver(MatrixDriver):
         self.height = self.hw_cfg.rows
         self.num_pixels = self.width * self.height
         self._brightness = config.get("brightness", 1.0)
+        self._brightness_lut = self._build_brightness_lut(self._brightness)
 
         fps = config.get("target_fps", 30)
         self.controller = MatrixController(self.hw_cfg, fps)
@@ -40,6 +41,13 @@ class HUB75ControllerDriver(MatrixDriver):
         """Hardware is already initialised in MatrixController constructor."""
         return True
 
+    @staticmethod
+    def _build_brightness_lut(brightness: float) -> Tuple[int, ...]:
+        """Pre-scale every 0-255 channel value once per brightness change."""
+        if brightness >= 0.999:
+            return tuple(range(256))
+        return tuple(int(value * brightness) for value in range(256))
+
     def _apply_brightness(self, rgb: Tuple[int, int, int]) -> Tuple[int, int, int]:
         if self._brightness >= 0.999:
             return rgb
@@ -53,8 +61,15 @@ class HUB75ControllerDriver(MatrixDriver):
     ) -> None:
         """Copy an RGB frame buffer to the hardware canvas."""
         canvas = self.controller.create_frame()
-
-        if isinstance(frame_buffer, bytearray):
+        lut = self._brightness_lut
+        # Canvases without SetImage (older bindings) take the SetPixel paths
+        image = self.frame_to_image(frame_buffer) if hasattr(canvas, 'SetImage') else None
+
+        if image is not None:
+            # Scale through the brightness LUT and push the whole frame in
+            # C: Image.point() maps each band, SetImage() copies in one call
+            canvas.SetImage(image.point(lut * 3), 0, 0, unsafe=True)  # type: ignore[attr-defined]
+        elif isinstance(frame_buffer, bytearray):
             # Convert byte-stream (RGBRGB...) into pixel tuples on the fly.
             buf_len = len(frame_buffer)
             for idx in range(0, buf_len, 3):
@@ -63,19 +78,20 @@ class HUB75ControllerDriver(MatrixDriver):
                     break
                 x = pixel_index % self.width
                 y = pixel_index // self.width
-                r = frame_buffer[idx]
-                g = frame_buffer[idx + 1]
-                b = frame_buffer[idx + 2]
-                r, g, b = self._apply_brightness((r, g, b))
+                r = lut[frame_buffer[idx]]
+                g = lut[frame_buffer[idx + 1]]
+                b = lut[frame_buffer[idx + 2]]
                 canvas.SetPixel(x, y, r, g, b)  # type: ignore[attr-defined]
         else:
+            if hasattr(frame_buffer, 'tolist'):
+                # NumPy (N, 3) frame: unbox to plain ints in one call
+                frame_buffer = frame_buffer.tolist()
             for pixel_index, (r, g, b) in enumerate(frame_buffer):
                 if pixel_index >= self.num_pixels:
                     break
                 x = pixel_index % self.width
                 y = pixel_index // self.width
-                r, g, b = self._apply_brightness((r, g, b))
-                canvas.SetPixel(x, y, r, g, b)  # type: ignore[attr-defined]
+                canvas.SetPixel(x, y, lut[r], lut[g], lut[b])  # type: ignore[attr-defined]
 
         self.controller.swap(canvas)
 
@@ -88,9 +104,7 @@ class HUB75ControllerDriver(MatrixDriver):
     def fill(self, r: int, g: int, b: int) -> None:
         canvas = self.controller.create_frame()
         r, g, b = self._apply_brightness((r, g, b))
-        for y in range(self.height):
-            for x in range(self.width):
-                canvas.SetPixel(x, y, r, g, b)  # type: ignore[attr-defined]
+        canvas.Fill(r, g, b)  # type: ignore[attr-defined]
         self.controller.swap(canvas)
 
     def clear(self) -> None:
@@ -101,6 +115,7 @@ class HUB75ControllerDriver(MatrixDriver):
 
     def set_brightness(self, brightness: float) -> None:
         self._brightness = max(0.0, min(1.0, brightness))
+        self._brightness_lut = self._build_brightness_lut(self._brightness)
 
     def cleanup(self) -> None:
         self.controller.cleanup() 
\ No newline at end of file
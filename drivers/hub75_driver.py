@@ -15,6 +15,7 @@ import time
 import os
 from typing import Tuple, List, Union, Optional
 from .matrix_driver import MatrixDriver
+from core.hardware_config import HardwareConfig
 
 logger = logging.getLogger(__name__)
 
@@ -38,14 +39,12 @@ class HUB75Driver(MatrixDriver):
     def __init__(self, config):
         super().__init__(config)
         
-        # Get HUB75 configuration
-        hub_config = config.get("hub75", {})
-        self.width = hub_config.get("cols", 64)
-        self.height = hub_config.get("rows", 64)
+        # Resolve HUB75 options once; initialize() reads plain attributes
+        self.hw_cfg = HardwareConfig.from_config(config)
+        self.width = self.hw_cfg.cols
+        self.height = self.hw_cfg.rows
         self.num_pixels = self.width * self.height
         
-        # Store config for initialization
-        self.hub_config = hub_config
         self.matrix = None
         self.canvas = None
         
@@ -64,13 +63,14 @@ class HUB75Driver(MatrixDriver):
         try:
             # Configure with optimization guide settings from Henner Zeller's library
             options = RGBMatrixOptions()
+            hw_cfg = self.hw_cfg
             
             # Basic configuration
-            options.rows = self.hub_config.get("rows", 64)
-            options.cols = self.hub_config.get("cols", 64)
-            options.chain_length = self.hub_config.get("chain_length", 1)
-            options.parallel = self.hub_config.get("parallel", 1)
-            options.hardware_mapping = 'adafruit-hat'  # Adafruit HAT/Bonnet
+            options.rows = hw_cfg.rows
+            options.cols = hw_cfg.cols
+            options.chain_length = hw_cfg.chain_length
+            options.parallel = hw_cfg.parallel
+            options.hardware_mapping = hw_cfg.hardware_mapping  # Adafruit HAT/Bonnet by default
             
             # Critical performance settings from optimization guide
             # -----------------------------------------------------
@@ -78,17 +78,17 @@ class HUB75Driver(MatrixDriver):
             # - Pi 1: Use value 1
             # - Pi 2/Zero: Use value 2
             # - Pi 3/4: Use value 4 (prevents flickering)
-            options.gpio_slowdown = self.hub_config.get("gpio_slowdown", 4)  # Pi 3B+ optimal
+            options.gpio_slowdown = hw_cfg.gpio_slowdown  # Pi 3B+ optimal
             
             # pwm_bits: Balance between color depth and refresh rate
             # - Higher values (11): Better color depth but slower refresh
             # - Lower values (7): Less color depth but faster refresh
-            options.pwm_bits = self.hub_config.get("pwm_bits", 11)  # Balance color/speed
+            options.pwm_bits = hw_cfg.pwm_bits  # Balance color/speed
             
             # pwm_lsb_nanoseconds: Fine-tune PWM timing
             # - Lower values: Faster refresh but may cause instability
             # - Higher values: More stable but slower refresh
-            options.pwm_lsb_nanoseconds = self.hub_config.get("pwm_lsb_nanoseconds", 130)
+            options.pwm_lsb_nanoseconds = hw_cfg.pwm_lsb_nanoseconds
             
             # Set brightness (0-100%)
             options.brightness = int(self.config.get("brightness", 0.8) * 100)
@@ -113,7 +113,7 @@ class HUB75Driver(MatrixDriver):
             # Setting a fixed refresh rate can stabilize animations under load
             # 0 = no limit (maximum possible refresh rate)
             # 120 = limit to 120 Hz (good balance for Pi 3B+)
-            limit_refresh = self.hub_config.get("limit_refresh", 0)
+            limit_refresh = hw_cfg.limit_refresh
             if limit_refresh > 0:
                 options.limit_refresh_rate_hz = limit_refresh
                 logger.info(f"Refresh rate limited to {limit_refresh} Hz")
@@ -123,9 +123,9 @@ class HUB75Driver(MatrixDriver):
             # scan_mode: 0=progressive, 1=interlaced
             # row_address_type: 0-4 for different panel types
             # multiplexing: 0-17 for different multiplexing schemes
-            options.scan_mode = self.hub_config.get("scan_mode", 0)  # Progressive scan
-            options.row_address_type = self.hub_config.get("row_address_type", 0)
-            options.multiplexing = self.hub_config.get("multiplexing", 0)
+            options.scan_mode = hw_cfg.scan_mode  # Progressive scan
+            options.row_address_type = hw_cfg.row_address_type
+            options.multiplexing = hw_cfg.multiplexing
             
             # CPU isolation check (requires isolcpus=3 in boot cmdline)
             # -----------------------------------------------------
@@ -232,13 +232,19 @@ class HUB75Driver(MatrixDriver):
         3. This ensures the entire frame updates at once
         
         Args:
-            frame_buffer: Either a list of (r,g,b) tuples or a bytearray
+            frame_buffer: A list of (r,g,b) tuples, an (N, 3) uint8 array
+                or a bytearray
         """
         if not self.matrix or not self.canvas:
             return
             
-        # Render to off-screen canvas for flicker-free updates
-        if isinstance(frame_buffer, bytearray):
+        # Render to off-screen canvas for flicker-free updates; canvases
+        # without SetImage (older bindings) take the SetPixel paths below
+        image = self.frame_to_image(frame_buffer) if hasattr(self.canvas, 'SetImage') else None
+        if image is not None:
+            # Whole frame in one C call instead of a SetPixel per pixel
+            self.canvas.SetImage(image, 0, 0, unsafe=True)
+        elif isinstance(frame_buffer, bytearray):
             # Bytearray format - fast path
             idx = 0
             for y in range(self.height):
@@ -250,7 +256,9 @@ class HUB75Driver(MatrixDriver):
                         self.canvas.SetPixel(x, y, r, g, b)
                         idx += 3
         else:
-            # List of tuples format
+            # List of tuples format (NumPy frames unboxed to lists first)
+            if hasattr(frame_buffer, 'tolist'):
+                frame_buffer = frame_buffer.tolist()
             idx = 0
             for y in range(self.height):
                 for x in range(self.width):
@@ -273,9 +281,8 @@ class HUB75Driver(MatrixDriver):
         if not self.canvas:
             return
             
-        for y in range(self.height):
-            for x in range(self.width):
-                self.canvas.SetPixel(x, y, r, g, b)
+        # Canvas.Fill() sets the whole panel in C instead of per-pixel calls
+        self.canvas.Fill(r, g, b)
     
     def clear(self) -> None:
         """Clear the matrix."""
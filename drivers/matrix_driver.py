@@ -6,9 +6,21 @@ Defines the interface that both WS2811 and HUB75 drivers must implement.
 # flake8: noqa: E501  # allow occasional long log strings
 
 from abc import ABC, abstractmethod
-from typing import Tuple, List, Union
+from typing import Tuple, List, Union, Optional
 import logging
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +48,8 @@ class MatrixDriver(ABC):
         """Update the physical matrix with frame data.
         
         Args:
-            frame_buffer: Either a list of (R, G, B) tuples or a bytearray
+            frame_buffer: A list of (R, G, B) tuples, an (N, 3) uint8
+                NumPy array or a bytearray
         """
         pass
     
@@ -93,6 +106,34 @@ class MatrixDriver(ABC):
         """Get current brightness setting."""
         return self._brightness
     
+    def frame_to_image(self, frame_buffer) -> "Optional[Image.Image]":
+        """Convert a full row-major frame to a PIL image in one C pass.
+        
+        Pillow stores RGB as 4 bytes per pixel, so ``frombuffer`` copies
+        packed RGB frames instead of sharing their memory. The image is a
+        snapshot and must be rebuilt for every frame, not cached per buffer.
+        
+        Args:
+            frame_buffer: An (N, 3) uint8 NumPy array or a bytearray
+        
+        Returns:
+            An RGB image of the frame, or None when Pillow is missing or the
+            frame cannot be read as width x height RGB
+        """
+        if not HAS_PIL:
+            return None
+        
+        if hasattr(frame_buffer, 'shape'):
+            if (frame_buffer.shape != (self.num_pixels, 3)
+                    or frame_buffer.dtype != np.uint8
+                    or not frame_buffer.flags['C_CONTIGUOUS']):
+                return None
+        elif not isinstance(frame_buffer, bytearray) or len(frame_buffer) != self.num_pixels * 3:
+            return None
+        
+        return Image.frombuffer('RGB', (self.width, self.height), frame_buffer,
+                                'raw', 'RGB', 0, 1)
+    
     def __enter__(self):
         """Context manager entry."""
         self.initialize()
@@ -118,7 +159,11 @@ class SimulatedMatrixDriver(MatrixDriver):
             self.height = config.get("ws2811", {}).get("height", 10)
             
         self.num_pixels = self.width * self.height
-        self.pixels = [(0, 0, 0)] * self.num_pixels
+        # Persistent (N, 3) uint8 framebuffer, updated in place every frame
+        if HAS_NUMPY:
+            self.pixels = np.zeros((self.num_pixels, 3), dtype=np.uint8)
+        else:
+            self.pixels = [(0, 0, 0)] * self.num_pixels
         
         logger.info(f"Initialized simulated matrix: {self.width}x{self.height}")
     
@@ -129,6 +174,16 @@ class SimulatedMatrixDriver(MatrixDriver):
     
     def update(self, frame_buffer: Union[List[Tuple[int, int, int]], bytearray]) -> None:
         """Update simulated matrix."""
+        if HAS_NUMPY:
+            # Copy straight into the persistent buffer - no per-pixel objects
+            if isinstance(frame_buffer, bytearray):
+                count = min(len(frame_buffer) // 3, self.num_pixels)
+                src = np.frombuffer(frame_buffer, dtype=np.uint8, count=count * 3).reshape(-1, 3)
+            else:
+                src = np.asarray(frame_buffer[:self.num_pixels], dtype=np.uint8).reshape(-1, 3)
+            self.pixels[:len(src)] = src
+            return
+        
         if isinstance(frame_buffer, bytearray):
             # Convert bytearray to tuples
             for i in range(0, len(frame_buffer), 3):
@@ -162,11 +217,17 @@ class SimulatedMatrixDriver(MatrixDriver):
         g = int(g * self._brightness)
         b = int(b * self._brightness)
         
-        self.pixels = [(r, g, b)] * self.num_pixels
+        if HAS_NUMPY:
+            self.pixels[:] = (r, g, b)
+        else:
+            self.pixels = [(r, g, b)] * self.num_pixels
     
     def clear(self) -> None:
         """Clear simulated matrix."""
-        self.pixels = [(0, 0, 0)] * self.num_pixels
+        if HAS_NUMPY:
+            self.pixels.fill(0)
+        else:
+            self.pixels = [(0, 0, 0)] * self.num_pixels
     
     def show(self) -> None:
         """Update simulated display (no-op)."""
@@ -184,6 +245,8 @@ class SimulatedMatrixDriver(MatrixDriver):
     
     def get_frame(self) -> List[Tuple[int, int, int]]:
         """Get current frame for testing/visualization."""
+        if HAS_NUMPY:
+            return [tuple(p) for p in self.pixels.tolist()]
         return self.pixels.copy()
 
 
@@ -6,6 +6,12 @@ import logging
 from typing import Tuple, List, Union
 from .matrix_driver import MatrixDriver
 
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -39,8 +45,10 @@ class WS2811Driver(MatrixDriver):
         self._back_buffer = [(0, 0, 0)] * self.num_pixels
         self._front_buffer = None  # Will be the NeoPixel object
         
-        # Brightness
+        # Brightness is folded into the gamma table, so output needs one
+        # lookup per channel and NeoPixel never rescales the buffer itself
         self._brightness = config.get("brightness", 0.8)
+        self._build_output_table()
         
         logger.info(f"WS2811 driver configured: {self.width}x{self.height}, "
                    f"serpentine={self.serpentine}, pin={self.data_pin}")
@@ -59,7 +67,7 @@ class WS2811Driver(MatrixDriver):
             self._front_buffer = neopixel.NeoPixel(
                 pin,
                 self.num_pixels,
-                brightness=self._brightness,
+                brightness=1.0,  # Applied through the output table
                 auto_write=False,  # Important for performance
                 pixel_order=neopixel.GRB
             )
@@ -86,17 +94,21 @@ class WS2811Driver(MatrixDriver):
             for i in range(0, min(len(frame_buffer), self.num_pixels * 3), 3):
                 idx = i // 3
                 if idx < self.num_pixels:
-                    r = self.gamma_table[frame_buffer[i]]
-                    g = self.gamma_table[frame_buffer[i + 1]]
-                    b = self.gamma_table[frame_buffer[i + 2]]
+                    r = self._output_table[frame_buffer[i]]
+                    g = self._output_table[frame_buffer[i + 1]]
+                    b = self._output_table[frame_buffer[i + 2]]
                     self._back_buffer[idx] = (r, g, b)
+        elif hasattr(frame_buffer, 'shape') and self._output_array is not None:
+            # NumPy frames: correct every channel in one table gather
+            corrected = self._output_array[frame_buffer[:self.num_pixels]]
+            self._back_buffer[:len(corrected)] = map(tuple, corrected.tolist())
         else:
             # List of tuples format
             for i, (r, g, b) in enumerate(frame_buffer[:self.num_pixels]):
                 # Apply gamma correction using lookup table
-                r = self.gamma_table[min(255, max(0, r))]
-                g = self.gamma_table[min(255, max(0, g))]
-                b = self.gamma_table[min(255, max(0, b))]
+                r = self._output_table[min(255, max(0, r))]
+                g = self._output_table[min(255, max(0, g))]
+                b = self._output_table[min(255, max(0, b))]
                 self._back_buffer[i] = (r, g, b)
         
         # Swap buffers - update NeoPixel array
@@ -113,9 +125,9 @@ class WS2811Driver(MatrixDriver):
         
         if 0 <= idx < self.num_pixels:
             # Apply gamma correction
-            r = self.gamma_table[min(255, max(0, r))]
-            g = self.gamma_table[min(255, max(0, g))]
-            b = self.gamma_table[min(255, max(0, b))]
+            r = self._output_table[min(255, max(0, r))]
+            g = self._output_table[min(255, max(0, g))]
+            b = self._output_table[min(255, max(0, b))]
             
             self._back_buffer[idx] = (r, g, b)
             
@@ -125,9 +137,9 @@ class WS2811Driver(MatrixDriver):
     def fill(self, r: int, g: int, b: int) -> None:
         """Fill entire matrix with a single color."""
         # Apply gamma correction
-        r = self.gamma_table[min(255, max(0, r))]
-        g = self.gamma_table[min(255, max(0, g))]
-        b = self.gamma_table[min(255, max(0, b))]
+        r = self._output_table[min(255, max(0, r))]
+        g = self._output_table[min(255, max(0, g))]
+        b = self._output_table[min(255, max(0, b))]
         
         color = (r, g, b)
         self._back_buffer = [color] * self.num_pixels
@@ -148,12 +160,16 @@ class WS2811Driver(MatrixDriver):
             self._front_buffer.show()
     
     def set_brightness(self, brightness: float) -> None:
-        """Set global brightness."""
+        """Set global brightness (takes effect from the next frame)."""
         self._brightness = max(0.0, min(1.0, brightness))
-        
-        if self._front_buffer:
-            self._front_buffer.brightness = self._brightness
-            logger.debug(f"WS2811 brightness set to {self._brightness}")
+        self._build_output_table()
+        logger.debug(f"WS2811 brightness set to {self._brightness}")
+    
+    def _build_output_table(self) -> None:
+        """Pre-calculate gamma-corrected, brightness-scaled channel values."""
+        self._output_table = [int(value * self._brightness) for value in self.gamma_table]
+        self._output_array = (np.asarray(self._output_table, dtype=np.uint8)
+                              if HAS_NUMPY else None)
     
     def cleanup(self) -> None:
         """Clean up resources and turn off display."""
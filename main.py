@@ -11,6 +11,7 @@ This is the main entry point that integrates all the building blocks:
 - Performance monitoring and optimization
 """
 
+import os
 import signal
 import sys
 import threading
@@ -104,6 +105,9 @@ class LightBoxController:
             host = self.config.get("web.host", "0.0.0.0")
             debug = self.config.get("web.debug", False)
             
+            # Worker threads inherit this thread's CPU set
+            self._pin_web_threads()
+            
             logger.info(f"Starting web server on {host}:{port}")
             self.web_app.socketio.run(
                 self.web_app,
@@ -120,6 +124,20 @@ class LightBoxController:
         finally:
             self.stop()
     
+    def _pin_web_threads(self):
+        """Keep the web server off the render and matrix refresh cores."""
+        cpus = self.config.get("performance.web_cpus")
+        if not cpus or not hasattr(os, "sched_setaffinity"):
+            return
+        
+        try:
+            cpus = set(cpus) & os.sched_getaffinity(0)
+            if cpus:
+                os.sched_setaffinity(0, cpus)
+                logger.info(f"Web server pinned to CPUs {sorted(cpus)}")
+        except OSError as e:
+            logger.warning(f"Could not set web server CPU affinity: {e}")
+    
     def stop(self):
         """Stop the LightBox system."""
         logger.info("Stopping LightBox system...")
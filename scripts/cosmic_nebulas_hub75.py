@@ -5,50 +5,42 @@ Important: lookup_table, cache, array, numpy
 Zero critical bad patterns
 """
 
+import numpy as np
+
+from utils.frame_utils import polar_grid, write_pixels
+
+
 def animate(pixels, config, frame):
-    """Cosmic Nebulas Hub75 animation - 75% optimized with all required patterns"""
+    """Cosmic Nebulas Hub75 animation - whole frame computed with NumPy broadcasting"""
     
     # Essential: config.get() for all parameters
-    width = config.get('matrix_width', 10)
-    height = config.get('matrix_height', 10)
+    width = config.matrix_width
+    height = config.matrix_height
     speed = config.get('speed', 1.0)
     brightness = config.get('brightness', 1.0)
-    intensity = config.get('intensity', 1.0)
+    hue_base = config.get('hue_offset', 0.3)
+    saturation = config.get('saturation', 0.9)
+    color_intensity = config.get('color_intensity', 1.0)
     
-    # Important: Pre-computed lookup_table for performance
     t = frame * config.get('time_scale', 0.05) * speed
     
-    # Important: cache-friendly iteration pattern
-    # Important: efficient array processing
-    for y in range(height):
-        for x in range(width):
-            # Essential: config.xy_to_index() for coordinate mapping
-            idx = config.xy_to_index(x, y)
-            
-            
-            # Spiral pattern using lookup_table approach  
-            cx, cy = width/2, height/2
-            dist = ((x-cx)**2 + (y-cy)**2)**0.5
-            spiral_phase = (dist * 0.5 + t) % 6.28
-            intensity = abs(spiral_phase - 3.14) / 3.14
-            
-            # Color calculation
-            hue_base = config.get('hue_offset', 0.3)
-            hue = (hue_base + intensity * 0.4 + t * 0.02) % 1.0
-            saturation = config.get('saturation', 0.9)
-            value = brightness * intensity * config.get('color_intensity', 1.0)
-            
-            # Essential: config.hsv_to_rgb() for cached color conversion
-            r, g, b = config.hsv_to_rgb(hue, saturation, value)
-            
-            # Essential: config.gamma_correct() for fast gamma correction
-            gamma = config.get('gamma', 2.2)
-            r = config.gamma_correct(r, gamma)
-            g = config.gamma_correct(g, gamma)
-            b = config.gamma_correct(b, gamma)
-            
-            if 0 <= idx < len(pixels):
-                pixels[idx] = (int(r * 255), int(g * 255), int(b * 255))
+    # Distance from centre for every pixel, cached per frame size
+    dist, _ = polar_grid(width, height)
+    
+    # Spiral pattern
+    spiral_phase = (dist * 0.5 + t) % 6.28
+    intensity = np.abs(spiral_phase - 3.14) / 3.14
+    
+    # Color calculation
+    hue = (hue_base + intensity * 0.4 + t * 0.02) % 1.0
+    value = brightness * intensity * color_intensity
+    
+    # Essential: config.hsv_to_rgb() / config.gamma_correct() in array form
+    rgb = config.hsv_to_rgb_array(hue, saturation, value)
+    rgb = config.gamma_correct_array(rgb)
+    
+    # Essential: config.xy_to_index() mapping, cached as an index array
+    write_pixels(pixels, config.pixel_indices(width, height), rgb)
 
 # Important: numpy compatibility metadata
 ANIMATION_INFO = {
@@ -3,11 +3,137 @@ Feathered Fire Animation for HUB75
 Realistic fire effect with smooth feathering and enhanced realism
 """
 
-import random
-import math
+from math import hypot
+
+import numpy as np
+
+from utils.frame_utils import write_pixels
+
+_rng = np.random.default_rng()
 
 # Pre-generate heat map with extra border for feathering
-heat_map = [[0.0 for _ in range(66)] for _ in range(66)]
+heat_map = np.zeros((66, 66), dtype=np.float32)
+
+# Gaussian-like weights for the 5-pixel upward feathering
+_RISE_WEIGHTS = np.exp(-(np.arange(-2, 3) ** 2) / 2.0).astype(np.float32)
+
+# Distance-based weights for the 3x3 render sampling
+_SAMPLE_OFFSETS = [(dy, dx) for dy in range(-1, 2) for dx in range(-1, 2)]
+_SAMPLE_WEIGHTS = [1.0 / (1.0 + hypot(dx, dy)) for dy, dx in _SAMPLE_OFFSETS]
+_SAMPLE_TOTAL = sum(_SAMPLE_WEIGHTS)
+
+# Pre-generated texture noise; each frame reads a shifted 64x64 window
+_NOISE_TILE = ((_rng.random((128, 128)) - 0.5) * 0.02).astype(np.float32)
+
+# Glow gamma (1/1.8) lookup table for 0-255 channel values
+_GLOW_LUT = (np.arange(256) / 255.0) ** (1.0 / 1.8) * 255
+
+# Per-size tables, built on first use
+_rise_norm = {}
+_edge_fade = {}
+
+# Glow table with brightness applied and clipped to 0-255, rebuilt only
+# when the brightness setting changes
+_glow = {'brightness': None, 'lut': None}
+
+
+def _get_rise_norm(width):
+    """Sum of in-bounds rise weights for columns 1..width of the heat map."""
+    norm = _rise_norm.get(width)
+    if norm is None:
+        valid = np.ones(width + 2, dtype=np.float32)
+        norm = np.convolve(valid, _RISE_WEIGHTS, mode='same')[1:width + 1]
+        _rise_norm[width] = norm
+    return norm
+
+
+def _get_edge_fade(width, height):
+    """Fade factor for pixels within 3 of the left, right and top edges."""
+    fade = _edge_fade.get((width, height))
+    if fade is None:
+        xs = np.arange(width)
+        ys = np.arange(height)[:, None]
+        edge_distance = np.minimum(np.minimum(xs, width - 1 - xs), height - 1 - ys)
+        fade = np.where(edge_distance < 3, edge_distance / 3.0, 1.0)[..., None]
+        _edge_fade[(width, height)] = fade
+    return fade
+
+
+def _get_glow_lut(brightness):
+    """Final 0-255 output value for every edge-faded channel value."""
+    if _glow['brightness'] != brightness:
+        lut = (_GLOW_LUT * brightness).astype(int)
+        _glow['lut'] = np.clip(lut, 0, 255).astype(np.uint8)
+        _glow['brightness'] = brightness
+    return _glow['lut']
+
+
+def _update_heat(width, height, time):
+    """Seed the bottom row and propagate heat upward one row at a time."""
+    # Random heat sources at bottom with hot spots that move across
+    xs = np.arange(1, width + 1)
+    base_heat = _rng.random(width) * 0.7 + 0.3
+    hot_spot = np.sin(xs * 0.2 + time) * 0.3 + 0.7
+    heat_map[height, 1:width + 1] = base_heat * hot_spot
+    
+    # Draw turbulence and ember chances for the whole map up front
+    turbulence = (_rng.random((height, width)) - 0.5) * 0.1
+    embers = _rng.random((height, width)) < 0.001
+    
+    norm = _get_rise_norm(width)
+    for y in range(height - 1, 0, -1):
+        # Gather heat from 5 pixels below for feathering
+        below = heat_map[y + 1, :width + 2]
+        heat = np.convolve(below, _RISE_WEIGHTS, mode='same')[1:width + 1] / norm
+        
+        # Add turbulence for more realistic fire movement
+        heat += turbulence[y]
+        
+        # Cool as it rises, with variable cooling based on position
+        cooling = 0.55 - (y / height) * 0.1  # Less cooling at bottom
+        row = np.maximum(0, heat * cooling)
+        
+        # Add occasional embers that rise higher
+        if embers[y].any():
+            row[embers[y]] = np.minimum(1.0, row[embers[y]] + 0.5)
+        heat_map[y, 1:width + 1] = row
+
+
+def _heat_to_rgb(heat):
+    """Enhanced color mapping with more transitions, returns (..., 3) ints."""
+    bands = [
+        heat > 0.95,  # Blue-white core (hottest)
+        heat > 0.85,  # White hot
+        heat > 0.7,   # Yellow-white
+        heat > 0.5,   # Yellow to orange
+        heat > 0.3,   # Orange to red
+        heat > 0.15,  # Dark red with glow
+        heat > 0.05,  # Very dark red/ember
+    ]
+    zero = np.zeros_like(heat)
+    r = np.select(bands, [
+        240 + (15 * (heat - 0.95) / 0.05).astype(int),
+        255, 255, 255, 255,
+        100 + (155 * (heat - 0.15) / 0.15).astype(int),
+        (100 * heat / 0.15).astype(int),
+    ], (20 * heat / 0.05).astype(int))
+    g = np.select(bands, [
+        240 + (15 * (heat - 0.95) / 0.05).astype(int),
+        255, 255,
+        200 + (55 * (heat - 0.5) / 0.2).astype(int),
+        (180 * (heat - 0.3) / 0.2).astype(int),
+        (30 * (heat - 0.15) / 0.15).astype(int),
+        zero,
+    ], zero)
+    b = np.select(bands, [
+        255,
+        240 + (15 * (heat - 0.85) / 0.1).astype(int),
+        (200 * (1 - (heat - 0.7) / 0.15)).astype(int),
+        (50 * (1 - (heat - 0.5) / 0.2)).astype(int),
+        zero, zero, zero,
+    ], zero)
+    return np.stack([r, g, b], axis=-1)
+
 
 def animate(pixels, config, frame):
     """
@@ -15,147 +141,35 @@ def animate(pixels, config, frame):
     """
     width = config.matrix_width
     height = config.matrix_height
-    total_pixels = width * height
     
     # Add some time-based variation
     time = frame * 0.1
     
     # Update heat map with more sophisticated fire simulation
     if frame % 2 == 0:  # Update every other frame
-        # Add random heat sources at bottom with variation
-        for x in range(1, width + 1):
-            # Create hot spots that move slightly
-            base_heat = random.random() * 0.7 + 0.3
-            # Add periodic hot spots that move across the bottom
-            hot_spot = math.sin(x * 0.2 + time) * 0.3 + 0.7
-            heat_map[height][x] = base_heat * hot_spot
-        
-        # Propagate heat upward with feathering
-        for y in range(height - 1, 0, -1):
-            for x in range(1, width + 1):
-                # Gather heat from below with wider sampling for smoother flow
-                heat = 0
-                total_weight = 0
-                
-                # Sample from 5 pixels below for feathering
-                for dx in range(-2, 3):
-                    if 0 <= x + dx <= width + 1:
-                        # Gaussian-like weights for smooth blending
-                        weight = math.exp(-(dx * dx) / 2.0)
-                        heat += heat_map[y + 1][x + dx] * weight
-                        total_weight += weight
-                
-                heat /= total_weight
-                
-                # Add turbulence for more realistic fire movement
-                turbulence = (random.random() - 0.5) * 0.1
-                heat += turbulence
-                
-                # Cool as it rises, with variable cooling based on position
-                cooling = 0.55 - (y / height) * 0.1  # Less cooling at bottom
-                heat_map[y][x] = max(0, heat * cooling)
-                
-                # Add occasional embers that rise higher
-                if random.random() < 0.001:
-                    heat_map[y][x] = min(1.0, heat_map[y][x] + 0.5)
+        _update_heat(width, height, time)
     
-    # Render fire with smooth gradients
-    for i in range(total_pixels):
-        x = i % width
-        y = i // width
-        
-        # Sample heat with bilinear interpolation for ultra-smooth rendering
-        heat = 0
-        sample_count = 0
-        
-        # Sample surrounding pixels for feathering
-        for dy in range(-1, 2):
-            for dx in range(-1, 2):
-                sx = x + dx + 1  # Offset for border
-                sy = y + dy + 1
-                
-                if 0 <= sx <= width + 1 and 0 <= sy <= height + 1:
-                    # Distance-based weight for sampling
-                    dist = math.sqrt(dx*dx + dy*dy)
-                    weight = 1.0 / (1.0 + dist)
-                    heat += heat_map[sy][sx] * weight
-                    sample_count += weight
-        
-        heat /= sample_count
-        
-        # Add subtle noise for texture
-        noise = (random.random() - 0.5) * 0.02
-        heat += noise
-        heat = max(0, min(1, heat))
-        
-        # Enhanced color mapping with more transitions
-        if heat > 0.95:
-            # Blue-white core (hottest)
-            r = 240 + int(15 * (heat - 0.95) / 0.05)
-            g = 240 + int(15 * (heat - 0.95) / 0.05)
-            b = 255
-        elif heat > 0.85:
-            # White hot
-            intensity = (heat - 0.85) / 0.1
-            r = 255
-            g = 255
-            b = 240 + int(15 * intensity)
-        elif heat > 0.7:
-            # Yellow-white
-            intensity = (heat - 0.7) / 0.15
-            r = 255
-            g = 255
-            b = int(200 * (1 - intensity))
-        elif heat > 0.5:
-            # Yellow to orange
-            intensity = (heat - 0.5) / 0.2
-            r = 255
-            g = 200 + int(55 * intensity)
-            b = int(50 * (1 - intensity))
-        elif heat > 0.3:
-            # Orange to red
-            intensity = (heat - 0.3) / 0.2
-            r = 255
-            g = int(180 * intensity)
-            b = 0
-        elif heat > 0.15:
-            # Dark red with glow
-            intensity = (heat - 0.15) / 0.15
-            r = 100 + int(155 * intensity)
-            g = int(30 * intensity)
-            b = 0
-        elif heat > 0.05:
-            # Very dark red/ember
-            intensity = heat / 0.15
-            r = int(100 * intensity)
-            g = 0
-            b = 0
-        else:
-            # Black with possible faint glow
-            r = int(20 * heat / 0.05)
-            g = 0
-            b = 0
-        
-        # Apply edge feathering for smooth boundaries
-        edge_distance = min(x, width - 1 - x, height - 1 - y)
-        if edge_distance < 3:
-            edge_fade = edge_distance / 3.0
-            r = int(r * edge_fade)
-            g = int(g * edge_fade)
-            b = int(b * edge_fade)
-        
-        # Apply brightness and gamma correction for more realistic glow
-        gamma = 1.8
-        r = int(pow(r / 255.0, 1.0 / gamma) * 255 * config.brightness)
-        g = int(pow(g / 255.0, 1.0 / gamma) * 255 * config.brightness)
-        b = int(pow(b / 255.0, 1.0 / gamma) * 255 * config.brightness)
-        
-        # Ensure valid range
-        pixels[i] = (
-            max(0, min(255, r)),
-            max(0, min(255, g)),
-            max(0, min(255, b))
-        )
+    # Sample surrounding pixels for feathering (weighted 3x3 neighbourhood)
+    heat = np.zeros((height, width), dtype=np.float32)
+    for (dy, dx), weight in zip(_SAMPLE_OFFSETS, _SAMPLE_WEIGHTS):
+        heat += heat_map[1 + dy:height + 1 + dy, 1 + dx:width + 1 + dx] * weight
+    heat /= _SAMPLE_TOTAL
+    
+    # Add subtle noise for texture
+    oy = (frame * 37) % 64
+    ox = (frame * 59) % 64
+    heat += _NOISE_TILE[oy:oy + height, ox:ox + width]
+    heat = np.clip(heat, 0, 1)
+    
+    rgb = _heat_to_rgb(heat)
+    
+    # Apply edge feathering for smooth boundaries
+    rgb = (rgb * _get_edge_fade(width, height)).astype(int)
+    
+    # Apply brightness and gamma correction for more realistic glow, with
+    # the valid-range clamp folded into the same table
+    rgb = _get_glow_lut(config.brightness)[rgb]
+    write_pixels(pixels, np.arange(width * height), rgb)
 
 # Animation metadata
 ANIMATION_INFO = {
@@ -75,18 +75,22 @@ make install-python PYTHON=$(which python3)
 echo ""
 echo "⚙️  Configuring system for optimal performance..."
 
+# config.txt changes are collected here and written in one pass below
+CONFIG_ADDITIONS=()
+GPU_MEM_FIX=0
+
 # Disable audio (conflicts with PWM)
 echo "   - Disabling audio..."
 if ! grep -q "dtparam=audio=off" /boot/config.txt; then
-    echo "dtparam=audio=off" >> /boot/config.txt
+    CONFIG_ADDITIONS+=("dtparam=audio=off")
 fi
 
 # Set GPU memory split
 echo "   - Setting GPU memory to 16MB..."
 if ! grep -q "gpu_mem=" /boot/config.txt; then
-    echo "gpu_mem=16" >> /boot/config.txt
-else
-    sed -i 's/gpu_mem=.*/gpu_mem=16/' /boot/config.txt
+    CONFIG_ADDITIONS+=("gpu_mem=16")
+elif ! grep -qx "gpu_mem=16" /boot/config.txt; then
+    GPU_MEM_FIX=1
 fi
 
 # Optional: Disable Bluetooth on Pi 3/4
@@ -96,12 +100,28 @@ if [[ "$PI_MODEL" == *"Pi 3"* ]] || [[ "$PI_MODEL" == *"Pi 4"* ]]; then
     if [[ $REPLY =~ ^[Yy]$ ]]; then
         echo "   - Disabling Bluetooth..."
         if ! grep -q "dtoverlay=disable-bt" /boot/config.txt; then
-            echo "dtoverlay=disable-bt" >> /boot/config.txt
+            CONFIG_ADDITIONS+=("dtoverlay=disable-bt")
         fi
         systemctl disable bluetooth
     fi
 fi
 
+# Write config.txt once: build the new file next to the old one (same
+# filesystem) and rename it into place
+if [ ${#CONFIG_ADDITIONS[@]} -gt 0 ] || [ "$GPU_MEM_FIX" = "1" ]; then
+    {
+        if [ "$GPU_MEM_FIX" = "1" ]; then
+            sed 's/gpu_mem=.*/gpu_mem=16/' /boot/config.txt
+        else
+            cat /boot/config.txt
+        fi
+        if [ ${#CONFIG_ADDITIONS[@]} -gt 0 ]; then
+            printf '%s\n' "${CONFIG_ADDITIONS[@]}"
+        fi
+    } > /boot/config.txt.lightbox-new
+    mv /boot/config.txt.lightbox-new /boot/config.txt
+fi
+
 # Optional: CPU isolation for best performance
 echo ""
 read -p "Enable CPU isolation for best performance? (y/N): " -n 1 -r
@@ -109,7 +129,8 @@ echo
 if [[ $REPLY =~ ^[Yy]$ ]]; then
     echo "   - Configuring CPU isolation..."
     if ! grep -q "isolcpus=" /boot/cmdline.txt; then
-        sed -i '$ s/$/ isolcpus=3/' /boot/cmdline.txt
+        # Also keep the scheduler tick, RCU callbacks and device IRQs off core 3
+        sed -i '$ s/$/ isolcpus=3 nohz_full=3 rcu_nocbs=3 irqaffinity=0-2/' /boot/cmdline.txt
         echo "   ✅ CPU core 3 will be isolated on next reboot"
     else
         echo "   ℹ️  CPU isolation already configured"
@@ -3,7 +3,34 @@ Ocean Waves Animation for HUB75
 Smooth ocean wave patterns with foam effects
 """
 
-import math
+import numpy as np
+
+from utils.frame_utils import write_pixels
+
+# (H, W) arrays of x + y, built once per size
+_diagonals = {}
+
+# (H, 1, 1) depth gradients, built once per height
+_depths = {}
+
+
+def _diagonal_index(width, height):
+    """Index of the x + y diagonal for every pixel."""
+    index = _diagonals.get((width, height))
+    if index is None:
+        index = np.arange(width) + np.arange(height)[:, None]
+        _diagonals[(width, height)] = index
+    return index
+
+
+def _depth_gradient(height):
+    """Depth effect - darker at bottom, as a per-row color scale."""
+    depth = _depths.get(height)
+    if depth is None:
+        depth = (1.0 - (np.arange(height, dtype=np.float64) / height) * 0.5)[:, None, None]
+        _depths[height] = depth
+    return depth
+
 
 def animate(pixels, config, frame):
     """
@@ -11,66 +38,51 @@ def animate(pixels, config, frame):
     """
     width = config.matrix_width
     height = config.matrix_height
-    total_pixels = width * height
     
     # Slow time for smooth motion
     time = frame * 0.02 * config.speed
     
-    for i in range(total_pixels):
-        x = i % width
-        y = i // width
-        
-        # Create multiple wave layers
-        # Primary wave
-        wave1 = math.sin(x * 0.1 + time) * math.cos(y * 0.05 + time * 0.7)
-        
-        # Secondary wave at angle
-        wave2 = math.sin((x + y) * 0.07 + time * 1.3) * 0.7
-        
-        # Smaller ripples
-        ripple = math.sin(x * 0.3 + y * 0.2 + time * 2) * 0.3
-        
-        # Combine waves
-        wave_height = (wave1 + wave2 + ripple) / 3
-        
-        # Create depth effect - darker at bottom
-        depth = 1.0 - (y / height) * 0.5
-        
-        # Foam on wave peaks
-        foam = max(0, wave_height - 0.5) * 2
-        
-        # Ocean colors
-        if foam > 0.3:
-            # White foam
-            r = g = b = 0.9 + foam * 0.1
-        else:
-            # Ocean blue-green
-            base_hue = 180 + wave_height * 20  # Cyan to blue
-            brightness = 0.3 + abs(wave_height) * 0.4
-            
-            # Simple HSV for ocean colors
-            if base_hue < 195:
-                # Cyan-ish
-                r = 0
-                g = brightness * 0.8
-                b = brightness
-            else:
-                # Deeper blue
-                r = 0
-                g = brightness * 0.4
-                b = brightness
-        
-        # Apply depth
-        r *= depth
-        g *= depth
-        b *= depth
-        
-        # Convert to 0-255 and apply brightness
-        pixels[i] = (
-            int(r * 255 * config.brightness),
-            int(g * 255 * config.brightness),
-            int(b * 255 * config.brightness)
-        )
+    # 1-D coordinate vectors; every sine below is evaluated per row or per
+    # column (O(W+H)) and combined into the (H, W) grid by broadcasting
+    x = np.arange(width, dtype=np.float64)
+    y = np.arange(height, dtype=np.float64)[:, None]
+    
+    # Create multiple wave layers
+    # Primary wave: separable sin(x) * cos(y)
+    wave1 = np.sin(x * 0.1 + time) * np.cos(y * 0.05 + time * 0.7)
+    
+    # Secondary wave at angle: depends only on x + y, so tabulate the
+    # W + H - 1 diagonals once and gather
+    diagonals = np.sin(np.arange(width + height - 1) * 0.07 + time * 1.3) * 0.7
+    wave2 = diagonals[_diagonal_index(width, height)]
+    
+    # Smaller ripples: sin(a + b) = sin(a)cos(b) + cos(a)sin(b)
+    ripple_x = x * 0.3 + time * 2
+    ripple_y = y * 0.2
+    ripple = (np.sin(ripple_x) * np.cos(ripple_y) + np.cos(ripple_x) * np.sin(ripple_y)) * 0.3
+    
+    # Combine waves
+    wave_height = (wave1 + wave2 + ripple) / 3
+    
+    # Foam on wave peaks
+    foam = np.maximum(0, wave_height - 0.5) * 2
+    is_foam = foam > 0.3
+    
+    # Ocean blue-green: cyan-ish below hue 195, deeper blue above
+    base_hue = 180 + wave_height * 20
+    brightness = 0.3 + np.abs(wave_height) * 0.4
+    green = np.where(base_hue < 195, brightness * 0.8, brightness * 0.4)
+    
+    # White foam overrides the ocean color
+    white = 0.9 + foam * 0.1
+    r = np.where(is_foam, white, 0.0)
+    g = np.where(is_foam, white, green)
+    b = np.where(is_foam, white, brightness)
+    
+    # Apply depth, convert to 0-255 and apply brightness
+    rgb = np.stack([r, g, b], axis=-1) * _depth_gradient(height) * (255 * config.brightness)
+    rgb = np.clip(rgb.astype(int), 0, 255).astype(np.uint8)
+    write_pixels(pixels, np.arange(width * height), rgb)
 
 # Animation metadata
 ANIMATION_INFO = {
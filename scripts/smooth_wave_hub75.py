@@ -4,7 +4,10 @@ Optimized for minimal computation and smooth rendering
 Uses simple math for best performance
 """
 
-import math
+import numpy as np
+
+from utils.frame_utils import write_pixels
+
 
 def animate(pixels, config, frame):
     """
@@ -12,7 +15,6 @@ def animate(pixels, config, frame):
     """
     width = config.matrix_width
     height = config.matrix_height
-    total_pixels = width * height
     
     # Very slow time progression for smoothness
     t1 = frame * 0.01
@@ -22,53 +24,32 @@ def animate(pixels, config, frame):
     w_factor = 3.14159 / width
     h_factor = 3.14159 / height
     
-    for i in range(total_pixels):
-        x = i % width
-        y = i // width
-        
-        # Simple sine wave combination - no complex math
-        v1 = math.sin(x * w_factor + t1)
-        v2 = math.sin(y * h_factor + t2)
-        
-        # Combine waves
-        value = (v1 + v2 + 2) * 0.25  # Normalize to 0-1
-        
-        # Simple color calculation
-        hue = value * 360
-        
-        # Direct color mapping - no complex HSV conversion
-        if hue < 60:
-            r = 255
-            g = int(hue * 4.25)
-            b = 0
-        elif hue < 120:
-            r = int((120 - hue) * 4.25)
-            g = 255
-            b = 0
-        elif hue < 180:
-            r = 0
-            g = 255
-            b = int((hue - 120) * 4.25)
-        elif hue < 240:
-            r = 0
-            g = int((240 - hue) * 4.25)
-            b = 255
-        elif hue < 300:
-            r = int((hue - 240) * 4.25)
-            g = 0
-            b = 255
-        else:
-            r = 255
-            g = 0
-            b = int((360 - hue) * 4.25)
-        
-        # Apply brightness with bit shifting for speed
-        brightness = int(config.brightness * 255)
-        r = (r * brightness) >> 8
-        g = (g * brightness) >> 8
-        b = (b * brightness) >> 8
-        
-        pixels[i] = (r, g, b)
+    # Separable waves: one sine per column and one per row (O(W+H)),
+    # combined into the (H, W) grid with an outer sum
+    v1 = np.sin(np.arange(width) * w_factor + t1)
+    v2 = np.sin(np.arange(height) * h_factor + t2)
+    value = (np.add.outer(v2, v1) + 2) * 0.25  # Normalize to 0-1
+    
+    # Simple color calculation
+    hue = value * 360
+    
+    # Direct color mapping - no complex HSV conversion
+    sectors = [hue < 60, hue < 120, hue < 180, hue < 240, hue < 300]
+    r = np.select(sectors, [
+        255, ((120 - hue) * 4.25).astype(int), 0, 0, ((hue - 240) * 4.25).astype(int)
+    ], 255)
+    g = np.select(sectors, [
+        (hue * 4.25).astype(int), 255, 255, ((240 - hue) * 4.25).astype(int), 0
+    ], 0)
+    b = np.select(sectors, [
+        0, 0, ((hue - 120) * 4.25).astype(int), 255, 255
+    ], ((360 - hue) * 4.25).astype(int))
+    
+    # Apply brightness with bit shifting for speed
+    brightness = int(config.brightness * 255)
+    rgb = (np.stack([r, g, b], axis=-1) * brightness) >> 8
+    
+    write_pixels(pixels, np.arange(width * height), rgb.astype(np.uint8))
 
 # Animation metadata
 ANIMATION_INFO = {
@@ -100,22 +100,44 @@ fi
 # Configure GPIO for hardware PWM (if not already done)
 echo "⚡ Configuring GPIO for hardware PWM..."
 if ! grep -q "dtoverlay=pwm" /boot/config.txt; then
-    echo "dtparam=audio=off" | sudo tee -a /boot/config.txt
-    echo "dtoverlay=pwm-2chan,pin=18,func=2,pin2=13,func2=4" | sudo tee -a /boot/config.txt
+    printf '%s\n' "dtparam=audio=off" "dtoverlay=pwm-2chan,pin=18,func=2,pin2=13,func2=4" \
+        | sudo tee -a /boot/config.txt
     echo "✅ Hardware PWM configured"
 else
     echo "✅ Hardware PWM already configured"
 fi
 
 # Configure CPU isolation for better performance
+# isolcpus keeps tasks off core 3; nohz_full and rcu_nocbs also stop the
+# scheduler tick and RCU callbacks there, and irqaffinity steers device
+# interrupts to cores 0-2 (kernels without NO_HZ_FULL ignore nohz_full)
 echo "🚀 Configuring CPU isolation..."
-if ! grep -q "isolcpus=3" /boot/cmdline.txt; then
-    sudo sed -i 's/$/ isolcpus=3/' /boot/cmdline.txt
+CMDLINE_EXTRAS="isolcpus=3 nohz_full=3 rcu_nocbs=3 irqaffinity=0-2"
+# Set LIGHTBOX_CPUIDLE_OFF=1 to also disable CPU idle states (lower wake
+# latency at the cost of power and heat)
+if [ "${LIGHTBOX_CPUIDLE_OFF:-0}" = "1" ]; then
+    CMDLINE_EXTRAS="$CMDLINE_EXTRAS cpuidle.off=1"
+fi
+# Collect the missing parameters and rewrite the boot file once
+CMDLINE_MISSING=""
+for param in $CMDLINE_EXTRAS; do
+    if ! grep -qw -- "${param%%=*}" /boot/cmdline.txt; then
+        CMDLINE_MISSING="$CMDLINE_MISSING $param"
+    fi
+done
+if [ -n "$CMDLINE_MISSING" ]; then
+    sudo sed -i "1 s/\$/$CMDLINE_MISSING/" /boot/cmdline.txt
     echo "✅ CPU isolation configured"
 else
     echo "✅ CPU isolation already configured"
 fi
 
+# Keep every systemd-started service on cores 0-2 as well, so system
+# daemons stay off core 3 even if the cmdline change is lost (e.g. after a
+# firmware update rewrites /boot). LightBox pins its own threads explicitly.
+sudo mkdir -p /etc/systemd/system.conf.d
+printf '[Manager]\nCPUAffinity=0-2\n' | sudo tee /etc/systemd/system.conf.d/99-lightbox.conf > /dev/null
+
 # Set up Python virtual environment
 echo "🐍 Setting up Python virtual environment..."
 cd ~/LightBox_Organized
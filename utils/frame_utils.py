@@ -6,6 +6,13 @@ Provides frame buffer management and manipulation utilities.
 from typing import List, Tuple, Optional, Any
 import time
 from collections import deque
+from functools import lru_cache
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 
 class FrameBuffer:
@@ -102,6 +109,53 @@ def copy_frame(source: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]
     return source.copy()
 
 
+def write_pixels(pixels: Any, indices: Any, colors: Any) -> None:
+    """
+    Scatter an array of colors into a frame in one pass.
+    
+    Args:
+        pixels: Target frame (list of tuples or (N, 3) uint8 ndarray)
+        indices: NumPy array of pixel indices
+        colors: NumPy array of RGB values with shape indices.shape + (3,)
+    """
+    indices = indices.ravel()
+    colors = colors.reshape(-1, 3)
+    valid = (indices >= 0) & (indices < len(pixels))
+    if not valid.all():
+        indices = indices[valid]
+        colors = colors[valid]
+    
+    if hasattr(pixels, 'shape'):
+        pixels[indices] = colors
+    else:
+        for i, color in zip(indices.tolist(), colors.tolist()):
+            pixels[i] = tuple(color)
+
+
+@lru_cache(maxsize=8)
+def polar_grid(width: int, height: int) -> Tuple[Any, Any]:
+    """
+    Get distance and angle from the frame centre for every pixel.
+    
+    The arrays only depend on the frame size, so they are computed once
+    and shared (read-only) between frames and animations.
+    
+    Args:
+        width: Frame width
+        height: Frame height
+        
+    Returns:
+        (dist, angle) float32 arrays of shape (height, width)
+    """
+    dx = np.arange(width, dtype=np.float32) - width / 2
+    dy = np.arange(height, dtype=np.float32)[:, None] - height / 2
+    dist = np.sqrt(dx * dx + dy * dy)
+    angle = np.arctan2(dy, dx).astype(np.float32)
+    dist.flags.writeable = False
+    angle.flags.writeable = False
+    return dist, angle
+
+
 def blend_frames(frame1: List[Tuple[int, int, int]], 
                  frame2: List[Tuple[int, int, int]], 
                  factor: float) -> List[Tuple[int, int, int]]:
@@ -117,6 +171,12 @@ def blend_frames(frame1: List[Tuple[int, int, int]],
         Blended frame
     """
     factor = max(0.0, min(1.0, factor))
+    
+    if hasattr(frame1, 'shape') and hasattr(frame2, 'shape'):
+        # NumPy frames: one vectorized pass instead of a per-pixel loop
+        n = min(len(frame1), len(frame2))
+        return (frame1[:n] * (1 - factor) + frame2[:n] * factor).astype(np.uint8)
+    
     result = []
     
     for i in range(min(len(frame1), len(frame2))):
@@ -145,6 +205,8 @@ def apply_frame_brightness(frame: List[Tuple[int, int, int]],
         Brightness-adjusted frame
     """
     brightness = max(0.0, min(1.0, brightness))
+    if hasattr(frame, 'shape'):
+        return (frame * brightness).astype(np.uint8)
     return [
         (int(r * brightness), int(g * brightness), int(b * brightness))
         for r, g, b in frame
@@ -169,8 +231,43 @@ def shift_frame(frame: List[Tuple[int, int, int]],
     Returns:
         Shifted frame
     """
+    if hasattr(frame, 'shape') and len(frame) == width * height:
+        # NumPy frames: move whole rows/columns with slicing instead of
+        # visiting every pixel
+        grid = frame.reshape(height, width, 3)
+        if wrap:
+            return np.roll(grid, (dy, dx), axis=(0, 1)).reshape(frame.shape)
+        result = np.zeros_like(grid)
+        if abs(dx) < width and abs(dy) < height:
+            result[max(dy, 0):height + min(dy, 0), max(dx, 0):width + min(dx, 0)] = \
+                grid[max(-dy, 0):height - max(dy, 0), max(-dx, 0):width - max(dx, 0)]
+        return result.reshape(frame.shape)
+    
     result = [(0, 0, 0)] * len(frame)
     
+    if len(frame) == width * height:
+        # List frames: clip the shift once per row and copy row slices
+        # instead of bounds-checking every pixel
+        if not wrap and (abs(dx) >= width or abs(dy) >= height):
+            return result
+        
+        x0, x1 = max(dx, 0), width + min(dx, 0)
+        k = dx % width
+        for y in range(height):
+            src_y = y - dy
+            if wrap:
+                src_y %= height
+            elif not 0 <= src_y < height:
+                continue
+            
+            row = frame[src_y * width:(src_y + 1) * width]
+            start = y * width
+            if wrap:
+                result[start:start + width] = row[width - k:] + row[:width - k]
+            else:
+                result[start + x0:start + x1] = row[x0 - dx:x1 - dx]
+        return result
+    
     for y in range(height):
         for x in range(width):
             src_x = x - dx
@@ -15,6 +15,8 @@ import time
 import importlib.util
 from werkzeug.utils import secure_filename
 
+from .app_simple import COMPRESS_AVAILABLE, configure_compression, configure_static_caching
+
 UPLOAD_FOLDER = 'scripts'
 ALLOWED_EXTENSIONS = {'py'}
 ALLOWED_FILE_TYPES = {'py', 'txt', 'json', 'md'}
@@ -91,6 +93,13 @@ def create_app(led_controller=None):
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
     app.config['SECRET_KEY'] = 'lightbox_secret_key'
     
+    # Compress HTML/CSS/JS/JSON responses (Brotli, then gzip)
+    if COMPRESS_AVAILABLE:
+        configure_compression(app)
+    
+    # Long-lived caching for versioned static assets, service worker at /sw.js
+    configure_static_caching(app)
+    
     # Initialize SocketIO
     socketio = SocketIO(app, cors_allowed_origins="*")
     
@@ -6,17 +6,18 @@ Consolidates the best features from all web implementations.
 import os
 import json
 import time
+import hashlib
+import gzip
 import threading
 import queue
-from pathlib import Path
-from functools import wraps
+from functools import wraps, lru_cache
 from typing import Dict, Any, Optional
 
 import logging
 
 # Try to import Flask dependencies
 try:
-    from flask import Flask, render_template, jsonify, request, send_from_directory
+    from flask import Flask, Response, render_template, jsonify, request, send_from_directory, url_for
     from flask_cors import CORS
     FLASK_AVAILABLE = True
 except ImportError:
@@ -34,6 +35,21 @@ except ImportError:
     SOCKETIO_AVAILABLE = False
     logger.warning("Flask-SocketIO not available - real-time updates disabled")
 
+# Try to import Flask-Compress for gzip/brotli responses
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+    logger.info("Flask-Compress not available - responses sent uncompressed")
+
+# Try to import orjson for faster JSON encoding of polled responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class ResponseCache:
     """Simple TTL cache for API responses."""
@@ -69,7 +85,12 @@ class ResponseCache:
 
 
 def cached_route(ttl: int = 60):
-    """Decorator for caching route responses."""
+    """Decorator caching a route's JSON body and answering with ETags.
+    
+    The wrapped view returns plain data. Its encoded body is kept for ``ttl``
+    seconds and every request is answered conditionally, so clients that
+    already hold the current copy get an empty 304.
+    """
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
@@ -77,22 +98,41 @@ def cached_route(ttl: int = 60):
             cache_key = f"{f.__name__}:{str(args)}:{str(kwargs)}"
             
             # Check cache
-            cached = response_cache.get(cache_key)
-            if cached is not None:
-                return cached
-            
-            # Generate response
-            response = f(*args, **kwargs)
-            
-            # Cache response
-            response_cache.set(cache_key, response, ttl)
+            body = response_cache.get(cache_key)
+            if body is None:
+                body = dump_json(f(*args, **kwargs))
+                response_cache.set(cache_key, body, ttl)
             
-            return response
+            return json_bytes_response(body)
         
         return decorated_function
     return decorator
 
 
+def dump_json(data: Any) -> bytes:
+    """Compact UTF-8 JSON, encoded with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data,
+            default=str,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        )
+    return json.dumps(data, separators=(',', ':'), default=str).encode('utf-8')
+
+
+def json_bytes_response(body: bytes):
+    """Encoded JSON with an ETag, answered with 304 when the client's copy matches."""
+    response = Response(body, mimetype='application/json')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.add_etag()
+    return response.make_conditional(request)
+
+
+def conditional_json(data: Any):
+    """JSON response with an ETag, answered with 304 when the client's copy matches."""
+    return json_bytes_response(dump_json(data))
+
+
 # Global cache instance
 response_cache = ResponseCache()
 
@@ -156,6 +196,80 @@ class UpdateBatcher:
                     logger.error(f"Error sending batch update: {e}")
 
 
+# Config sections editable through /api/hardware/config, in response order
+HARDWARE_SECTIONS = ('ws2811', 'hub75', 'performance', 'platform')
+
+
+# Versioned static URLs change whenever the file does, so they can be cached
+# by the browser for a year without ever serving stale assets
+STATIC_MAX_AGE = 365 * 24 * 3600
+
+# Each open /api/events stream holds a server thread. Streams are closed
+# after EVENT_STREAM_MAX_AGE seconds (the browser reconnects after
+# EVENT_STREAM_RETRY_MS) and at most MAX_EVENT_STREAMS run at once, so
+# dashboard tabs cannot starve the control routes of waitress threads
+WAITRESS_THREADS = 8
+MAX_EVENT_STREAMS = WAITRESS_THREADS // 2
+EVENT_STREAM_MAX_AGE = 60.0
+EVENT_STREAM_RETRY_MS = 1000
+
+# Sleep between event stream polls; run_server() swaps in eventlet.sleep
+# under eventlet, where time.sleep would block the hub
+_stream_sleep = time.sleep
+
+
+@lru_cache(maxsize=None)
+def _asset_version(static_folder: str, filename: str) -> str:
+    """Short content hash of a static file, computed once per process."""
+    try:
+        with open(os.path.join(static_folder, filename), 'rb') as f:
+            return hashlib.md5(f.read()).hexdigest()[:10]
+    except OSError:
+        return '0'
+
+
+def configure_static_caching(app):
+    """Serve content-versioned static assets with long-lived cache headers.
+    
+    Templates link assets through ``static_url(filename)``, which appends a
+    content hash. Responses for versioned URLs are marked immutable; HTML
+    pages and the service worker are revalidated on every load.
+    """
+    @app.context_processor
+    def static_helpers():
+        def static_url(filename):
+            version = _asset_version(app.static_folder, filename)
+            return url_for('static', filename=filename, v=version)
+        return {'static_url': static_url}
+    
+    @app.after_request
+    def set_cache_headers(response):
+        if request.path.startswith('/static/') and request.args.get('v'):
+            response.headers['Cache-Control'] = f'public, max-age={STATIC_MAX_AGE}, immutable'
+        elif response.mimetype == 'text/html':
+            response.headers['Cache-Control'] = 'no-cache'
+        return response
+    
+    @app.route('/sw.js')
+    def service_worker():
+        """Serve the service worker from the root so it controls every page."""
+        response = send_from_directory(app.static_folder, 'js/sw.js')
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+
+def configure_compression(app):
+    """Enable Brotli/gzip response compression on a Flask app."""
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIMETYPES'] = [
+        'text/html', 'text/css', 'application/javascript', 'application/json'
+    ]
+    app.config['COMPRESS_LEVEL'] = 6
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+
+
 def create_app(conductor):
     """Create Flask application with conductor integration."""
     if not FLASK_AVAILABLE:
@@ -169,6 +283,12 @@ def create_app(conductor):
     if conductor.config.get("web.enable_cors", False):
         CORS(app)
     
+    # Compress HTML/CSS/JS/JSON for clients on the Pi's Wi-Fi
+    if COMPRESS_AVAILABLE:
+        configure_compression(app)
+    
+    configure_static_caching(app)
+    
     # Create SocketIO if available
     socketio = None
     update_batcher = UpdateBatcher(
@@ -184,83 +304,135 @@ def create_app(conductor):
     app.socketio = socketio
     app.update_batcher = update_batcher
     
+    def apply_config_update(data: Dict[str, Any]):
+        """Apply a configuration update from HTTP or WebSocket clients."""
+        if 'brightness' in data:
+            conductor.set_brightness(float(data['brightness']))
+        
+        if 'speed' in data:
+            conductor.set_speed(float(data['speed']))
+        
+        if 'animation_program' in data:
+            conductor.set_animation(data['animation_program'])
+        
+        if 'color_palette' in data:
+            conductor.set_palette(data['color_palette'])
+        
+        # Clear cache on config change
+        response_cache.clear()
+        
+        # Send update via WebSocket
+        if app.socketio:
+            update_batcher.add_update('config_update', data)
+    
+    # Pages have no per-request content: render each once and keep the UTF-8
+    # and gzip bytes, so a page load costs no template or compression work
+    page_cache = {}
+    
+    def render_page(template: str):
+        page = page_cache.get(template)
+        if page is None:
+            body = render_template(template).encode('utf-8')
+            page = page_cache[template] = (body, gzip.compress(body, compresslevel=9))
+        return page
+    
+    def serve_page(template: str):
+        body, gzipped = render_page(template)
+        if 'gzip' in request.headers.get('Accept-Encoding', ''):
+            response = Response(gzipped, mimetype='text/html')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(body, mimetype='text/html')
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.add_etag()
+        return response.make_conditional(request)
+    
+    def config_snapshot() -> Dict[str, Any]:
+        """Current user-facing configuration."""
+        return {
+            'brightness': conductor.config.get('brightness'),
+            'speed': conductor.config.get('speed'),
+            'animation_program': conductor.config.get('animation_program'),
+            'color_palette': conductor.config.get('color_palette'),
+            'matrix_type': conductor.config.get('matrix_type'),
+            'target_fps': conductor.config.get('target_fps')
+        }
+    
+    def animation_list():
+        """Available animations with their parameters."""
+        return [
+            {'name': name, 'params': anim.params}
+            for name, anim in conductor.animations.items()
+        ]
+    
+    def preset_names():
+        """Names of the saved presets."""
+        return conductor.config.list_presets()
+    
+    # Sections the dashboard can request in one round trip
+    dashboard_sections = {
+        'config': config_snapshot,
+        'animations': animation_list,
+        'presets': preset_names,
+        'status': conductor.get_status,
+        'performance': conductor.performance.get_stats,
+    }
+    
     # API Routes
     
     @app.route('/')
     def index():
         """Serve the main interface."""
-        return render_template('index.html')
+        return serve_page('index.html')
     
     @app.route('/comprehensive')
     def comprehensive():
         """Serve the comprehensive parameter interface."""
-        return render_template('comprehensive.html')
+        return serve_page('comprehensive.html')
     
     @app.route('/api/status')
     def get_status():
         """Get current system status."""
-        return jsonify(conductor.get_status())
+        return conditional_json(conductor.get_status())
+    
+    @app.route('/api/dashboard')
+    def get_dashboard():
+        """Return several dashboard sections in a single response.
+        
+        ``?sections=config,status`` selects what to build; only the requested
+        sections are computed. Without the argument every section is sent.
+        """
+        requested = request.args.get('sections')
+        names = requested.split(',') if requested else dashboard_sections
+        return conditional_json({
+            name: dashboard_sections[name]()
+            for name in names
+            if name in dashboard_sections
+        })
     
     @app.route('/api/config', methods=['GET', 'POST'])
     def handle_config():
         """Get or update configuration."""
         if request.method == 'GET':
-            # Return current config
-            config_data = {
-                'brightness': conductor.config.get('brightness'),
-                'speed': conductor.config.get('speed'),
-                'animation_program': conductor.config.get('animation_program'),
-                'color_palette': conductor.config.get('color_palette'),
-                'matrix_type': conductor.config.get('matrix_type'),
-                'target_fps': conductor.config.get('target_fps')
-            }
-            return jsonify(config_data)
+            return conditional_json(config_snapshot())
         
         else:  # POST
             # Update configuration
-            data = request.get_json()
-            
-            if 'brightness' in data:
-                conductor.set_brightness(float(data['brightness']))
-            
-            if 'speed' in data:
-                conductor.set_speed(float(data['speed']))
-            
-            if 'animation_program' in data:
-                conductor.set_animation(data['animation_program'])
-            
-            if 'color_palette' in data:
-                conductor.set_palette(data['color_palette'])
-            
-            # Clear cache on config change
-            response_cache.clear()
-            
-            # Send update via WebSocket
-            if app.socketio:
-                update_batcher.add_update('config_update', data)
-            
+            apply_config_update(request.get_json())
             return jsonify({'status': 'success'})
     
     @app.route('/api/animations')
     @cached_route(ttl=300)  # Cache for 5 minutes
     def get_animations():
         """Get list of available animations."""
-        animations = []
-        
-        for name, anim in conductor.animations.items():
-            animations.append({
-                'name': name,
-                'params': anim.params
-            })
-        
-        return jsonify(animations)
+        return animation_list()
     
     @app.route('/api/programs')
     @cached_route(ttl=300)  # Cache for 5 minutes
     def get_programs():
         """Get list of available animation programs (alias for animations)."""
         # Programs and animations are the same thing in this context
-        return get_animations()
+        return animation_list()
     
     @app.route('/api/brightness', methods=['POST'])
     def set_brightness():
@@ -299,12 +471,13 @@ def create_app(conductor):
         else:
             return jsonify({'error': 'Animation not found'}), 404
     
+    # The palette list never changes while running: encode it once
+    palettes_json = dump_json(['rainbow', 'fire', 'ocean', 'forest'])
+    
     @app.route('/api/palettes')
-    @cached_route(ttl=300)
     def get_palettes():
         """Get available color palettes."""
-        palettes = ['rainbow', 'fire', 'ocean', 'forest']
-        return jsonify(palettes)
+        return json_bytes_response(palettes_json)
     
     @app.route('/api/palette', methods=['POST'])
     def set_palette():
@@ -321,14 +494,7 @@ def create_app(conductor):
     @app.route('/api/presets')
     def get_presets():
         """Get list of saved presets."""
-        preset_dir = Path("presets")
-        presets = []
-        
-        if preset_dir.exists():
-            for preset_file in preset_dir.glob("*.json"):
-                presets.append(preset_file.stem)
-        
-        return jsonify(presets)
+        return jsonify(preset_names())
     
     @app.route('/api/preset/<name>', methods=['GET', 'POST', 'DELETE'])
     def handle_preset(name):
@@ -341,15 +507,13 @@ def create_app(conductor):
                 return jsonify({'error': 'Preset not found'}), 404
         
         elif request.method == 'POST':
-            # Save preset
+            # Save preset; the file is written in the background
             conductor.save_preset(name)
-            return jsonify({'status': 'saved'})
+            return jsonify({'status': 'saved'}), 202
         
         else:  # DELETE
             # Delete preset
-            preset_path = Path("presets") / f"{name}.json"
-            if preset_path.exists():
-                preset_path.unlink()
+            if conductor.config.delete_preset(name):
                 return jsonify({'status': 'deleted'})
             else:
                 return jsonify({'error': 'Preset not found'}), 404
@@ -357,7 +521,55 @@ def create_app(conductor):
     @app.route('/api/performance')
     def get_performance():
         """Get performance metrics."""
-        return jsonify(conductor.performance.get_stats())
+        return conditional_json(conductor.performance.get_stats())
+    
+    stream_slots = threading.BoundedSemaphore(MAX_EVENT_STREAMS)
+    
+    @app.route('/api/events')
+    def event_stream():
+        """Stream status and performance changes as Server-Sent Events.
+        
+        One long-lived response replaces the dashboard's polling loops;
+        each event is only sent when its payload differs from the last one.
+        Streams end after EVENT_STREAM_MAX_AGE seconds and EventSource
+        reconnects; when every stream slot is taken the request gets a 503
+        and the page falls back to polling.
+        """
+        if not stream_slots.acquire(blocking=False):
+            return jsonify({'error': 'Too many event streams'}), 503
+        
+        interval = conductor.config.get("web.events_interval", 1.0)
+        
+        def generate():
+            last_sent = {}
+            idle = 0.0
+            deadline = time.monotonic() + EVENT_STREAM_MAX_AGE
+            yield b"retry: " + str(EVENT_STREAM_RETRY_MS).encode() + b"\n\n"
+            while time.monotonic() < deadline:
+                sent = False
+                for event, data in (('status', conductor.get_status()),
+                                    ('performance', conductor.performance.get_stats())):
+                    payload = dump_json(data)
+                    if last_sent.get(event) != payload:
+                        last_sent[event] = payload
+                        sent = True
+                        yield b"event: " + event.encode() + b"\ndata: " + payload + b"\n\n"
+                
+                # Comment line keeps idle connections open through proxies
+                idle = 0.0 if sent else idle + interval
+                if idle >= 15:
+                    idle = 0.0
+                    yield b": keep-alive\n\n"
+                
+                _stream_sleep(interval)
+        
+        response = Response(generate(), mimetype='text/event-stream')
+        # Runs when the server closes the response, even if the client
+        # disconnects before the generator starts
+        response.call_on_close(stream_slots.release)
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
     
     @app.route('/api/animation/param', methods=['POST'])
     def set_animation_param():
@@ -410,19 +622,17 @@ def create_app(conductor):
         if request.method == 'GET':
             # Return current hardware config
             hw_config = {
-                'ws2811': conductor.config.get('ws2811', {}),
-                'hub75': conductor.config.get('hub75', {}),
-                'performance': conductor.config.get('performance', {}),
-                'platform': conductor.config.get('platform', {})
+                section: conductor.config.snapshot(section)
+                for section in HARDWARE_SECTIONS
             }
-            return jsonify(hw_config)
+            return conditional_json(hw_config)
         
         else:  # POST
             # Update hardware configuration
             data = request.get_json()
             
             for section, config in data.items():
-                if section in ['ws2811', 'hub75', 'performance', 'platform']:
+                if section in HARDWARE_SECTIONS:
                     conductor.config.update_section(section, config)
             
             # Clear cache on hardware config change
@@ -478,6 +688,26 @@ def create_app(conductor):
         def handle_update_request():
             """Handle request for immediate update."""
             emit('status_update', conductor.get_status())
+        
+        @socketio.on('config_update')
+        def handle_config_update(data):
+            """Apply a coalesced batch of control changes sent over the socket."""
+            if isinstance(data, dict):
+                apply_config_update(data)
+        
+        @socketio.on('request_performance')
+        def handle_performance_request():
+            """Push performance metrics over the open socket."""
+            emit('performance_update', conductor.performance.get_stats())
+    
+    # Render and compress the pages at startup so the first visitor after
+    # a restart is served from the cache too
+    with app.test_request_context():
+        for template in ('index.html', 'comprehensive.html'):
+            try:
+                render_page(template)
+            except Exception as e:
+                logger.warning(f"Could not pre-render {template}: {e}")
     
     # Cleanup handler
     def cleanup():
@@ -502,12 +732,27 @@ def run_server(app, host='0.0.0.0', port=5001, production=False):
             from eventlet import wsgi
             import eventlet
             
+            global _stream_sleep
+            _stream_sleep = eventlet.sleep
             logger.info(f"Starting production server on {host}:{port}")
             wsgi.server(eventlet.listen((host, port)), app)
         except ImportError:
             logger.warning("Eventlet not available, falling back to development server")
             production = False
     
+    elif production:
+        # Plain Flask: a multi-threaded server keeps long-lived event streams
+        # from holding up control requests. Event streams may take at most
+        # half the threads; the rest stay free for the control routes
+        try:
+            from waitress import serve
+            
+            logger.info(f"Starting production server on {host}:{port}")
+            serve(app, host=host, port=port, threads=WAITRESS_THREADS, channel_timeout=120)
+        except ImportError:
+            logger.warning("Waitress not available, falling back to development server")
+            production = False
+    
     if not production:
         # Development server
         logger.info(f"Starting development server on {host}:{port}")
@@ -515,7 +760,8 @@ def run_server(app, host='0.0.0.0', port=5001, production=False):
         if hasattr(app, 'socketio') and app.socketio:
             app.socketio.run(app, host=host, port=port, debug=False, allow_unsafe_werkzeug=True)
         else:
-            app.run(host=host, port=port, debug=False)
+            # Threaded so long-lived event streams do not block other routes
+            app.run(host=host, port=port, debug=False, threaded=True)
 
 
 # Export main components
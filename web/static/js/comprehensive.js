@@ -3,6 +3,39 @@
  * Handles all configuration, optimization, and control features
  */
 
+// Delay before a slider drag is sent to the server
+const SLIDER_DEBOUNCE_MS = 120;
+
+// Performance panel refresh interval while the page is visible
+const PERFORMANCE_POLL_MS = 2000;
+
+/**
+ * Trailing-edge debounce: only the last call within `wait` ms runs.
+ * The returned function has flush() to run a pending call immediately.
+ */
+function debounce(fn, wait) {
+    let timer = null;
+    let pendingArgs = null;
+
+    const debounced = (...args) => {
+        pendingArgs = args;
+        clearTimeout(timer);
+        timer = setTimeout(debounced.flush, wait);
+    };
+
+    debounced.flush = () => {
+        clearTimeout(timer);
+        timer = null;
+        if (pendingArgs) {
+            const args = pendingArgs;
+            pendingArgs = null;
+            fn(...args);
+        }
+    };
+
+    return debounced;
+}
+
 class LightBoxController {
     constructor() {
         this.ws = null;
@@ -10,14 +43,35 @@ class LightBoxController {
         this.currentConfig = {};
         this.animations = [];
         this.presets = [];
-        this.updateInterval = null;
+        this.pollTimer = null;
+        this.performanceController = null;
+        this.pendingMetrics = null;
+        this.pendingConfig = null;
+        this.configRenderScheduled = false;
+        this.elements = {};
+        this.toastTimer = null;
         
         this.init();
     }
 
+    // Look up an element once and reuse it for every later render
+    el(id) {
+        return this.elements[id] || (this.elements[id] = document.getElementById(id));
+    }
+
+    // Show a short non-blocking message; alert() would stall polling and rAF
+    toast(message) {
+        const toast = this.el('toast');
+        toast.textContent = message;
+        toast.classList.add('visible');
+        clearTimeout(this.toastTimer);
+        this.toastTimer = setTimeout(() => toast.classList.remove('visible'), 2500);
+    }
+
     init() {
         this.setupEventListeners();
         this.setupTabs();
+        this.setupAnimationList();
         this.setupWebSocket();
         this.loadInitialData();
         this.startPerformanceUpdates();
@@ -85,6 +139,7 @@ class LightBoxController {
     setupSlider(id, callback) {
         const slider = document.getElementById(id);
         const valueDisplay = document.getElementById(`${id}-value`);
+        const send = debounce(callback, SLIDER_DEBOUNCE_MS);
         
         slider.addEventListener('input', (e) => {
             const value = parseFloat(e.target.value);
@@ -109,9 +164,13 @@ class LightBoxController {
                     displayValue = value.toString();
             }
             
+            // Display updates immediately; the request waits for the drag to settle
             valueDisplay.textContent = displayValue;
-            callback(value);
+            send(value);
         });
+        
+        // Release sends the final value without waiting
+        slider.addEventListener('change', () => send.flush());
     }
 
     setupConfigInput(id, configPath, type = 'text') {
@@ -133,20 +192,23 @@ class LightBoxController {
     }
 
     setupTabs() {
-        const tabs = document.querySelectorAll('.tab');
+        const tabContainer = document.querySelector('.tabs');
+        const tabs = tabContainer.querySelectorAll('.tab');
         const tabContents = document.querySelectorAll('.tab-content');
 
-        tabs.forEach(tab => {
-            tab.addEventListener('click', () => {
-                // Remove active class from all tabs and contents
-                tabs.forEach(t => t.classList.remove('active'));
-                tabContents.forEach(tc => tc.classList.remove('active'));
+        // One delegated listener for the whole tab bar
+        tabContainer.addEventListener('click', (e) => {
+            const tab = e.target.closest('.tab');
+            if (!tab) return;
 
-                // Add active class to clicked tab and corresponding content
-                tab.classList.add('active');
-                const tabId = tab.dataset.tab;
-                document.getElementById(`${tabId}-tab`).classList.add('active');
-            });
+            // Remove active class from all tabs and contents
+            tabs.forEach(t => t.classList.remove('active'));
+            tabContents.forEach(tc => tc.classList.remove('active'));
+
+            // Add active class to clicked tab and corresponding content
+            tab.classList.add('active');
+            const tabId = tab.dataset.tab;
+            document.getElementById(`${tabId}-tab`).classList.add('active');
         });
     }
 
@@ -172,12 +234,18 @@ class LightBoxController {
             });
 
             this.ws.on('status_update', (data) => {
+                if (data.performance) {
+                    this.updatePerformanceMetrics(data.performance);
+                }
+            });
+
+            this.ws.on('performance_update', (data) => {
                 this.updatePerformanceMetrics(data);
             });
 
         } catch (error) {
+            // fetchPerformanceData() already uses HTTP while disconnected
             console.warn('WebSocket not available, falling back to polling');
-            this.setupPolling();
         }
     }
 
@@ -197,57 +265,71 @@ class LightBoxController {
 
     async loadInitialData() {
         try {
-            // Load current configuration
-            const configResponse = await fetch('/api/config');
-            this.currentConfig = await configResponse.json();
-            this.updateUIFromConfig();
+            // Everything the panel needs on load, in one round trip
+            const response = await fetch('/api/dashboard?sections=config,animations,presets,status');
+            const data = await response.json();
 
-            // Load animations
-            const animationsResponse = await fetch('/api/animations');
-            this.animations = await animationsResponse.json();
+            this.currentConfig = data.config;
+            this.updateUIFromConfig();
+            this.animations = data.animations;
             this.populateAnimationList();
-
-            // Load presets
-            const presetsResponse = await fetch('/api/presets');
-            this.presets = await presetsResponse.json();
+            this.presets = data.presets;
             this.populatePresetList();
-
-            // Load system info
-            const statusResponse = await fetch('/api/status');
-            const status = await statusResponse.json();
-            this.updateSystemInfo(status);
-
+            this.updateSystemInfo(data.status);
         } catch (error) {
             console.error('Error loading initial data:', error);
         }
     }
 
+    async refreshConfig() {
+        const response = await fetch('/api/config');
+        this.currentConfig = await response.json();
+        this.updateUIFromConfig();
+    }
+
+    async refreshPresets() {
+        const response = await fetch('/api/presets');
+        this.presets = await response.json();
+        this.populatePresetList();
+    }
+
     updateUIFromConfig() {
+        // Several config updates can arrive in one batch: render once per frame
+        if (this.configRenderScheduled) return;
+        this.configRenderScheduled = true;
+
+        requestAnimationFrame(() => {
+            this.configRenderScheduled = false;
+            this.renderConfig();
+        });
+    }
+
+    renderConfig() {
         // Update basic controls
         if (this.currentConfig.brightness !== undefined) {
             const brightness = Math.round(this.currentConfig.brightness * 100);
-            document.getElementById('brightness').value = brightness;
-            document.getElementById('brightness-value').textContent = `${brightness}%`;
+            this.el('brightness').value = brightness;
+            this.el('brightness-value').textContent = `${brightness}%`;
         }
 
         if (this.currentConfig.speed !== undefined) {
             const speed = Math.round(this.currentConfig.speed * 100);
-            document.getElementById('speed').value = speed;
-            document.getElementById('speed-value').textContent = `${(speed / 100).toFixed(1)}x`;
+            this.el('speed').value = speed;
+            this.el('speed-value').textContent = `${(speed / 100).toFixed(1)}x`;
         }
 
         if (this.currentConfig.animation_program) {
-            document.getElementById('animation').value = this.currentConfig.animation_program;
+            this.el('animation').value = this.currentConfig.animation_program;
         }
 
         if (this.currentConfig.color_palette) {
-            document.getElementById('palette').value = this.currentConfig.color_palette;
+            this.el('palette').value = this.currentConfig.color_palette;
         }
 
         // Update target FPS
         if (this.currentConfig.target_fps !== undefined) {
-            document.getElementById('target-fps').value = this.currentConfig.target_fps;
-            document.getElementById('target-fps-value').textContent = this.currentConfig.target_fps.toString();
+            this.el('target-fps').value = this.currentConfig.target_fps;
+            this.el('target-fps-value').textContent = this.currentConfig.target_fps.toString();
         }
     }
 
@@ -268,17 +350,30 @@ class LightBoxController {
             // Add to list
             const item = document.createElement('div');
             item.className = 'animation-item';
+            item.dataset.animation = animation.name;
             item.textContent = animation.name;
-            item.addEventListener('click', () => {
-                document.querySelectorAll('.animation-item').forEach(i => i.classList.remove('active'));
-                item.classList.add('active');
-                this.updateConfig('animation_program', animation.name);
-                this.showAnimationParams(animation);
-            });
             animationList.appendChild(item);
         });
     }
 
+    setupAnimationList() {
+        // Items are rebuilt on every refresh; one listener on the container
+        // survives that and replaces a listener per item
+        const animationList = document.getElementById('animation-list');
+        animationList.addEventListener('click', (e) => {
+            const item = e.target.closest('.animation-item');
+            if (!item) return;
+
+            const animation = this.animations.find(a => a.name === item.dataset.animation);
+            if (!animation) return;
+
+            animationList.querySelectorAll('.animation-item.active').forEach(i => i.classList.remove('active'));
+            item.classList.add('active');
+            this.updateConfig('animation_program', animation.name);
+            this.showAnimationParams(animation);
+        });
+    }
+
     populatePresetList() {
         const presetSelect = document.getElementById('preset-list');
         presetSelect.innerHTML = '<option value="">Select preset...</option>';
@@ -319,10 +414,15 @@ class LightBoxController {
                     valueDisplay.className = 'value-display';
                     valueDisplay.textContent = input.value;
 
+                    const send = debounce(
+                        (value) => this.updateAnimationParam(key, value),
+                        SLIDER_DEBOUNCE_MS
+                    );
                     input.addEventListener('input', (e) => {
                         valueDisplay.textContent = e.target.value;
-                        this.updateAnimationParam(key, parseFloat(e.target.value));
+                        send(parseFloat(e.target.value));
                     });
+                    input.addEventListener('change', () => send.flush());
 
                     controlRow.appendChild(input);
                     controlRow.appendChild(valueDisplay);
@@ -359,64 +459,124 @@ class LightBoxController {
     }
 
     startPerformanceUpdates() {
-        this.updateInterval = setInterval(() => {
-            this.fetchPerformanceData();
-        }, 2000);
+        // Each poll schedules the next one only after it has finished, so
+        // requests cannot pile up behind a slow Pi. Bumping the chain id
+        // retires a poll that is still in flight when polling stops.
+        let chain = 0;
+        const schedule = (id) => {
+            this.pollTimer = setTimeout(async () => {
+                await this.fetchPerformanceData();
+                if (id === chain) schedule(id);
+            }, PERFORMANCE_POLL_MS);
+        };
+        const start = () => {
+            if (this.pollTimer === null) schedule(chain);
+        };
+        const stop = () => {
+            chain++;
+            clearTimeout(this.pollTimer);
+            this.pollTimer = null;
+        };
+
+        // Stop polling the Pi while the tab is hidden; refresh on return
+        document.addEventListener('visibilitychange', () => {
+            if (document.hidden) {
+                stop();
+            } else {
+                this.fetchPerformanceData();
+                start();
+            }
+        });
+
+        if (!document.hidden) {
+            start();
+        }
     }
 
     async fetchPerformanceData() {
+        if (this.isConnected) {
+            // Ask over the open socket instead of a new HTTP request
+            this.ws.emit('request_performance');
+            return;
+        }
+
+        // Keep at most one poll outstanding if the Pi is slow to answer
+        if (this.performanceController) this.performanceController.abort();
+        const controller = new AbortController();
+        this.performanceController = controller;
+        // Give up on a request that takes longer than three poll intervals
+        const watchdog = setTimeout(() => controller.abort(), 3 * PERFORMANCE_POLL_MS);
+
         try {
-            const response = await fetch('/api/performance');
+            const response = await fetch('/api/performance', { signal: controller.signal });
             const data = await response.json();
             this.updatePerformanceMetrics(data);
         } catch (error) {
+            if (error.name === 'AbortError') return;
             console.error('Error fetching performance data:', error);
+        } finally {
+            clearTimeout(watchdog);
+            if (this.performanceController === controller) this.performanceController = null;
         }
     }
 
     updatePerformanceMetrics(data) {
+        // Polls and socket pushes can land in the same frame: keep only the
+        // latest data and write the DOM once per animation frame
+        const scheduled = this.pendingMetrics !== null;
+        this.pendingMetrics = data;
+        if (scheduled) return;
+
+        requestAnimationFrame(() => {
+            const latest = this.pendingMetrics;
+            this.pendingMetrics = null;
+            this.renderPerformanceMetrics(latest);
+        });
+    }
+
+    renderPerformanceMetrics(data) {
         // Update FPS
         if (data.fps) {
-            document.getElementById('fps').textContent = data.fps.current?.toFixed(1) || '--';
+            this.el('fps').textContent = data.fps.current?.toFixed(1) || '--';
             this.updatePerformanceBar('fps-bar', data.fps.current, 60);
         }
 
         // Update CPU
         if (data.cpu_percent) {
-            document.getElementById('cpu').textContent = `${data.cpu_percent.current?.toFixed(1) || '--'}%`;
+            this.el('cpu').textContent = `${data.cpu_percent.current?.toFixed(1) || '--'}%`;
             this.updatePerformanceBar('cpu-bar', data.cpu_percent.current, 100);
         }
 
         // Update Memory
         if (data.memory_mb) {
-            document.getElementById('memory').textContent = `${data.memory_mb.current?.toFixed(0) || '--'} MB`;
+            this.el('memory').textContent = `${data.memory_mb.current?.toFixed(0) || '--'} MB`;
             this.updatePerformanceBar('memory-bar', data.memory_mb.current, 512);
         }
 
         // Update Frame Time
         if (data.frame_time_ms) {
-            document.getElementById('frame-time').textContent = `${data.frame_time_ms.current?.toFixed(1) || '--'} ms`;
+            this.el('frame-time').textContent = `${data.frame_time_ms.current?.toFixed(1) || '--'} ms`;
         }
 
         // Update dropped frames
         if (data.dropped_frames_percent) {
             const dropped = data.dropped_frames_percent.current || 0;
-            document.getElementById('dropped').textContent = `${dropped.toFixed(1)}%`;
+            this.el('dropped').textContent = `${dropped.toFixed(1)}%`;
         }
 
         // Update cache hit rate
         if (data.cache_hit_rate) {
             const hitRate = data.cache_hit_rate.current || 0;
-            document.getElementById('cache-hit').textContent = `${hitRate.toFixed(1)}%`;
+            this.el('cache-hit').textContent = `${hitRate.toFixed(1)}%`;
         }
     }
 
     updatePerformanceBar(barId, value, max) {
-        const bar = document.getElementById(barId);
+        const bar = this.el(barId);
         if (!bar || value === undefined) return;
 
         const percentage = Math.min((value / max) * 100, 100);
-        bar.style.width = `${percentage}%`;
+        bar.style.transform = `scaleX(${percentage / 100})`;
 
         // Color coding
         if (percentage < 50) {
@@ -428,18 +588,38 @@ class LightBoxController {
         }
     }
 
-    async updateConfig(key, value) {
+    updateConfig(key, value) {
+        // Coalesce changes made in the same frame into one update: several
+        // controls (or slider ticks) become a single message or request
+        const scheduled = this.pendingConfig !== null;
+        this.pendingConfig = Object.assign(this.pendingConfig || {}, { [key]: value });
+        if (!scheduled) {
+            requestAnimationFrame(() => {
+                const updates = this.pendingConfig;
+                this.pendingConfig = null;
+                this.sendConfig(updates);
+            });
+        }
+    }
+
+    async sendConfig(updates) {
+        if (this.isConnected) {
+            this.ws.emit('config_update', updates);
+            Object.assign(this.currentConfig, updates);
+            return;
+        }
+
         try {
             const response = await fetch('/api/config', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
                 },
-                body: JSON.stringify({ [key]: value }),
+                body: JSON.stringify(updates),
             });
 
             if (response.ok) {
-                this.currentConfig[key] = value;
+                Object.assign(this.currentConfig, updates);
             } else {
                 console.error('Failed to update config:', await response.text());
             }
@@ -509,7 +689,7 @@ class LightBoxController {
                 const response = await fetch(`/api/preset/${name}`, { method: 'POST' });
                 if (response.ok) {
                     console.log('Preset saved successfully');
-                    await this.loadInitialData(); // Refresh preset list
+                    await this.refreshPresets();
                 }
             } catch (error) {
                 console.error('Error saving preset:', error);
@@ -520,7 +700,7 @@ class LightBoxController {
     async saveNewPreset() {
         const name = document.getElementById('preset-name').value.trim();
         if (!name) {
-            alert('Please enter a preset name');
+            this.toast('Please enter a preset name');
             return;
         }
 
@@ -529,7 +709,7 @@ class LightBoxController {
             if (response.ok) {
                 console.log('Preset saved successfully');
                 document.getElementById('preset-name').value = '';
-                await this.loadInitialData(); // Refresh preset list
+                await this.refreshPresets();
             }
         } catch (error) {
             console.error('Error saving preset:', error);
@@ -539,7 +719,7 @@ class LightBoxController {
     async loadSelectedPreset() {
         const presetName = document.getElementById('preset-list').value;
         if (!presetName) {
-            alert('Please select a preset to load');
+            this.toast('Please select a preset to load');
             return;
         }
 
@@ -547,7 +727,7 @@ class LightBoxController {
             const response = await fetch(`/api/preset/${presetName}`, { method: 'GET' });
             if (response.ok) {
                 console.log('Preset loaded successfully');
-                await this.loadInitialData(); // Refresh UI
+                await this.refreshConfig();
             }
         } catch (error) {
             console.error('Error loading preset:', error);
@@ -557,7 +737,7 @@ class LightBoxController {
     async deleteSelectedPreset() {
         const presetName = document.getElementById('preset-list').value;
         if (!presetName) {
-            alert('Please select a preset to delete');
+            this.toast('Please select a preset to delete');
             return;
         }
 
@@ -566,7 +746,7 @@ class LightBoxController {
                 const response = await fetch(`/api/preset/${presetName}`, { method: 'DELETE' });
                 if (response.ok) {
                     console.log('Preset deleted successfully');
-                    await this.loadInitialData(); // Refresh preset list
+                    await this.refreshPresets();
                 }
             } catch (error) {
                 console.error('Error deleting preset:', error);
@@ -602,13 +782,6 @@ class LightBoxController {
             }
         });
     }
-
-    setupPolling() {
-        // Fallback polling if WebSocket is not available
-        setInterval(() => {
-            this.fetchPerformanceData();
-        }, 5000);
-    }
 }
 
 // Initialize when DOM is ready
@@ -618,7 +791,16 @@ document.addEventListener('DOMContentLoaded', () => {
 
 // Handle page unload
 window.addEventListener('beforeunload', () => {
-    if (window.lightboxController && window.lightboxController.updateInterval) {
-        clearInterval(window.lightboxController.updateInterval);
+    if (window.lightboxController && window.lightboxController.pollTimer !== null) {
+        clearTimeout(window.lightboxController.pollTimer);
     }
-});
\ No newline at end of file
+});
+
+// Cache the panel shell and assets for fast repeat loads
+if ('serviceWorker' in navigator) {
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register('/sw.js').catch(error => {
+            console.warn('Service worker registration failed:', error);
+        });
+    });
+}
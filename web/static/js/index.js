@@ -0,0 +1,406 @@
+// Status poll interval when Server-Sent Events are unavailable
+const STATUS_POLL_MS = 1000;
+
+// Global state
+let isConnected = false;
+let currentConfig = {};
+
+// Elements looked up once and reused by every status render
+const elements = {};
+function el(id) {
+    return elements[id] || (elements[id] = document.getElementById(id));
+}
+
+// Show a short non-blocking message; alert() would stall polling and rAF
+function showToast(message) {
+    const toast = el('toast');
+    toast.textContent = message;
+    toast.classList.add('visible');
+    clearTimeout(toast.hideTimer);
+    toast.hideTimer = setTimeout(() => toast.classList.remove('visible'), 2500);
+}
+
+// Update status indicator
+function updateConnectionStatus(connected) {
+    const indicator = el('connection-status');
+    if (connected) {
+        indicator.textContent = '🟢 Connected';
+        indicator.classList.add('connected');
+    } else {
+        indicator.textContent = '⚫ Disconnected';
+        indicator.classList.remove('connected');
+    }
+    isConnected = connected;
+}
+
+// In-flight status request, aborted when the next poll starts
+let statusController = null;
+
+// Fetch current status
+async function fetchStatus() {
+    // Keep at most one status request outstanding if the Pi is slow
+    if (statusController) statusController.abort();
+    const controller = new AbortController();
+    statusController = controller;
+    // Give up on a request that takes longer than three poll intervals
+    const watchdog = setTimeout(() => controller.abort(), 3 * STATUS_POLL_MS);
+
+    try {
+        const response = await fetch('/api/status', { signal: controller.signal });
+        if (response.ok) {
+            const data = await response.json();
+            updateConnectionStatus(true);
+            updateUI(data);
+        } else {
+            updateConnectionStatus(false);
+        }
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        updateConnectionStatus(false);
+        console.error('Error fetching status:', error);
+    } finally {
+        clearTimeout(watchdog);
+        if (statusController === controller) statusController = null;
+    }
+}
+
+// Latest status waiting to be rendered, and the program list last drawn
+let pendingStatus = null;
+let renderedPrograms = '';
+
+// Update UI with status data: keep only the latest status and apply all
+// DOM writes together in one animation frame
+function updateUI(data) {
+    const scheduled = pendingStatus !== null;
+    pendingStatus = data;
+    if (scheduled) return;
+
+    requestAnimationFrame(() => {
+        const latest = pendingStatus;
+        pendingStatus = null;
+        renderUI(latest);
+    });
+}
+
+function renderUI(data) {
+    // Update stats
+    if (data.stats) {
+        el('fps-counter').textContent = `${data.stats.fps} FPS`;
+        el('uptime').textContent = `Uptime: ${formatUptime(data.stats.uptime)}`;
+        el('frame-count').textContent = data.stats.frame_count;
+        el('current-program').textContent = data.stats.current_program;
+        el('last-update').textContent = new Date(data.stats.last_update).toLocaleTimeString();
+    }
+
+    // Update config
+    if (data.config) {
+        currentConfig = data.config;
+        el('brightness').value = data.config.brightness;
+        el('brightness-value').textContent = `${Math.round(data.config.brightness * 100)}%`;
+
+        el('speed').value = data.config.speed;
+        el('speed-value').textContent = `${data.config.speed}x`;
+
+        el('scale').value = data.config.scale;
+        el('scale-value').textContent = `${data.config.scale}x`;
+
+        el('intensity').value = data.config.intensity;
+        el('intensity-value').textContent = `${data.config.intensity}x`;
+
+        el('gamma').value = data.config.gamma;
+        el('gamma-value').textContent = data.config.gamma;
+
+        el('led-count').textContent = data.config.led_count;
+        el('palette-select').value = data.config.current_palette;
+    }
+
+    // Update programs, rebuilding the list only when it actually changed
+    const programsKey = JSON.stringify([data.programs, data.current_program]);
+    if (data.programs && programsKey !== renderedPrograms) {
+        renderedPrograms = programsKey;
+        const options = document.createDocumentFragment();
+        data.programs.forEach(program => {
+            const option = document.createElement('option');
+            option.value = program;
+            option.textContent = program.charAt(0).toUpperCase() + program.slice(1);
+            if (program === data.current_program) {
+                option.selected = true;
+            }
+            options.appendChild(option);
+        });
+        el('program-select').replaceChildren(options);
+    }
+}
+
+// Format uptime
+function formatUptime(seconds) {
+    if (seconds < 60) return `${seconds}s`;
+    if (seconds < 3600) return `${Math.floor(seconds / 60)}m ${seconds % 60}s`;
+    const hours = Math.floor(seconds / 3600);
+    const minutes = Math.floor((seconds % 3600) / 60);
+    return `${hours}h ${minutes}m`;
+}
+
+// Send config update
+async function updateConfig(config) {
+    try {
+        const response = await fetch('/api/config', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify(config)
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            console.log('Config updated:', data);
+        }
+    } catch (error) {
+        console.error('Error updating config:', error);
+    }
+}
+
+// Setup range input handlers
+function setupRangeInputs() {
+    const rangeInputs = [
+        { id: 'brightness', key: 'BRIGHTNESS', format: v => `${Math.round(v * 100)}%` },
+        { id: 'speed', key: 'SPEED', format: v => `${v}x` },
+        { id: 'scale', key: 'SCALE', format: v => `${v}x` },
+        { id: 'intensity', key: 'INTENSITY', format: v => `${v}x` },
+        { id: 'gamma', key: 'GAMMA', format: v => v }
+    ];
+
+    rangeInputs.forEach(input => {
+        const element = document.getElementById(input.id);
+        const display = document.getElementById(`${input.id}-value`);
+
+        element.addEventListener('input', (e) => {
+            const value = parseFloat(e.target.value);
+            display.textContent = input.format(value);
+        });
+
+        element.addEventListener('change', (e) => {
+            const value = parseFloat(e.target.value);
+            updateConfig({ [input.key]: value });
+        });
+    });
+}
+
+// Switch program
+document.getElementById('switch-program').addEventListener('click', async () => {
+    const program = document.getElementById('program-select').value;
+    try {
+        const response = await fetch('/api/program', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ program })
+        });
+
+        if (response.ok) {
+            console.log('Program switched to:', program);
+        }
+    } catch (error) {
+        console.error('Error switching program:', error);
+    }
+});
+
+// Apply palette
+document.getElementById('apply-palette').addEventListener('click', async () => {
+    const palette = document.getElementById('palette-select').value;
+    try {
+        const response = await fetch('/api/palette', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ palette })
+        });
+
+        if (response.ok) {
+            console.log('Palette applied:', palette);
+            updatePalettePreview();
+        }
+    } catch (error) {
+        console.error('Error applying palette:', error);
+    }
+});
+
+// Update palette preview
+function updatePalettePreview() {
+    // This would ideally fetch the actual palette colors
+    const preview = document.getElementById('palette-preview');
+    preview.innerHTML = '<div class="palette-swatch"></div>'.repeat(6);
+}
+
+// Program upload
+document.getElementById('upload-btn').addEventListener('click', () => {
+    document.getElementById('program-upload').click();
+});
+
+document.getElementById('program-upload').addEventListener('change', async (e) => {
+    const file = e.target.files[0];
+    if (!file) return;
+
+    const formData = new FormData();
+    formData.append('file', file);
+
+    try {
+        const response = await fetch('/api/upload', {
+            method: 'POST',
+            body: formData
+        });
+
+        if (response.ok) {
+            const data = await response.json();
+            showToast(`Program uploaded successfully: ${data.filename}`);
+            fetchStatus(); // Refresh program list
+        } else {
+            const error = await response.json();
+            showToast(`Upload failed: ${error.error}`);
+        }
+    } catch (error) {
+        console.error('Error uploading program:', error);
+        showToast('Upload failed');
+    }
+});
+
+// Preset management
+document.getElementById('save-preset').addEventListener('click', async () => {
+    const name = document.getElementById('preset-name').value.trim();
+    if (!name) {
+        showToast('Please enter a preset name');
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/save-preset', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ name })
+        });
+
+        if (response.ok) {
+            showToast(`Preset '${name}' saved successfully`);
+            document.getElementById('preset-name').value = '';
+            loadPresets();
+        }
+    } catch (error) {
+        console.error('Error saving preset:', error);
+    }
+});
+
+// Load presets
+async function loadPresets() {
+    try {
+        const response = await fetch('/api/presets');
+        if (response.ok) {
+            const data = await response.json();
+            const list = document.getElementById('preset-list');
+            list.innerHTML = '';
+
+            data.presets.forEach(preset => {
+                const item = document.createElement('div');
+                item.className = 'preset-item';
+                item.innerHTML = `
+                    <span>${preset}</span>
+                    <button class="btn btn-small" onclick="loadPreset('${preset}')">Load</button>
+                `;
+                list.appendChild(item);
+            });
+        }
+    } catch (error) {
+        console.error('Error loading presets:', error);
+    }
+}
+
+// Load specific preset
+window.loadPreset = async function(name) {
+    try {
+        const response = await fetch('/api/load-preset', {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ name })
+        });
+
+        if (response.ok) {
+            showToast(`Preset '${name}' loaded`);
+            fetchStatus(); // Refresh UI
+        }
+    } catch (error) {
+        console.error('Error loading preset:', error);
+    }
+};
+
+// Initialize
+document.addEventListener('DOMContentLoaded', () => {
+    setupRangeInputs();
+    updatePalettePreview();
+    loadPresets();
+
+    // Status arrives over one Server-Sent Events stream when the browser
+    // supports it, otherwise by polling; both pause while the tab is hidden
+    let statusTimer = null;
+    let pollChain = 0;
+    let eventSource = null;
+
+    // Without SSE, each poll schedules the next once it has finished
+    const schedulePoll = (id) => {
+        statusTimer = setTimeout(async () => {
+            await fetchStatus();
+            if (id === pollChain) schedulePoll(id);
+        }, STATUS_POLL_MS);
+    };
+    const startPolling = () => {
+        if (statusTimer === null) {
+            fetchStatus();
+            schedulePoll(pollChain);
+        }
+    };
+    const startUpdates = () => {
+        if (window.EventSource) {
+            if (!eventSource) {
+                eventSource = new EventSource('/api/events');
+                eventSource.addEventListener('status', (e) => {
+                    updateConnectionStatus(true);
+                    updateUI(JSON.parse(e.data));
+                });
+                eventSource.onerror = () => {
+                    updateConnectionStatus(false);
+                    // A refused stream (no /api/events, or every stream slot
+                    // busy) is not retried by the browser: poll instead
+                    if (eventSource && eventSource.readyState === EventSource.CLOSED) {
+                        eventSource = null;
+                        startPolling();
+                    }
+                };
+            }
+        } else {
+            startPolling();
+        }
+    };
+    const stopUpdates = () => {
+        if (eventSource) {
+            eventSource.close();
+            eventSource = null;
+        }
+        pollChain++;
+        clearTimeout(statusTimer);
+        statusTimer = null;
+    };
+    document.addEventListener('visibilitychange', () => {
+        if (document.hidden) {
+            stopUpdates();
+        } else {
+            startUpdates();
+        }
+    });
+    if (!document.hidden) {
+        startUpdates();
+    }
+});
+
+// Cache the panel shell and assets for fast repeat loads
+if ('serviceWorker' in navigator) {
+    window.addEventListener('load', () => {
+        navigator.serviceWorker.register('/sw.js').catch(error => {
+            console.warn('Service worker registration failed:', error);
+        });
+    });
+}
@@ -0,0 +1,109 @@
+/**
+ * LightBox Service Worker
+ * Keeps the control panel shell and static assets on the device so repeat
+ * loads do not wait on the Pi's Wi-Fi. API calls always go to the network.
+ */
+
+// Bump when the caching rules change so activate drops the old cache
+const CACHE_NAME = 'lightbox-v2';
+// Not every app serves every page (web/app.py has no /comprehensive), so
+// each page is cached on its own and missing ones are skipped
+const SHELL_PAGES = ['/', '/basic', '/comprehensive'];
+
+self.addEventListener('install', (event) => {
+    event.waitUntil(
+        caches.open(CACHE_NAME)
+            .then(cache => Promise.all(
+                SHELL_PAGES.map(page => cache.add(page).catch(() => undefined))
+            ))
+            .then(() => self.skipWaiting())
+    );
+});
+
+self.addEventListener('activate', (event) => {
+    // Drop caches left behind by older versions of this worker, then any
+    // asset versions superseded while the previous worker was running
+    event.waitUntil(
+        caches.keys()
+            .then(keys => Promise.all(
+                keys.filter(key => key !== CACHE_NAME).map(key => caches.delete(key))
+            ))
+            .then(() => pruneSupersededAssets())
+            .then(() => self.clients.claim())
+    );
+});
+
+/**
+ * Keep only the newest cached entry per versioned static path.
+ * Entries are stored in insertion order, so the last one for a path wins.
+ */
+function pruneSupersededAssets() {
+    return caches.open(CACHE_NAME).then(cache => cache.keys().then(requests => {
+        const latest = new Map();
+        requests.forEach(request => {
+            const url = new URL(request.url);
+            if (url.pathname.startsWith('/static/') && url.searchParams.has('v')) {
+                const previous = latest.get(url.pathname);
+                if (previous) {
+                    cache.delete(previous);
+                }
+                latest.set(url.pathname, request);
+            }
+        });
+    }));
+}
+
+/**
+ * Store a fresh response; for versioned assets, evict other versions of
+ * the same file so old ?v= entries do not pile up.
+ */
+function storeResponse(request, response) {
+    const copy = response.clone();
+    const url = new URL(request.url);
+    return caches.open(CACHE_NAME).then(cache => {
+        if (url.searchParams.has('v')) {
+            cache.keys().then(requests => requests.forEach(cached => {
+                const cachedUrl = new URL(cached.url);
+                if (cachedUrl.pathname === url.pathname && cachedUrl.search !== url.search) {
+                    cache.delete(cached);
+                }
+            }));
+        }
+        return cache.put(request, copy);
+    });
+}
+
+function networkFirst(request) {
+    return fetch(request)
+        .then(response => {
+            if (response.ok) {
+                storeResponse(request, response);
+            }
+            return response;
+        })
+        .catch(() => caches.match(request));
+}
+
+self.addEventListener('fetch', (event) => {
+    const request = event.request;
+    const url = new URL(request.url);
+
+    if (request.method !== 'GET' || url.origin !== self.location.origin) {
+        return;
+    }
+
+    if (url.pathname.startsWith('/static/') && url.searchParams.has('v')) {
+        // Versioned assets never change under the same URL: cache first
+        event.respondWith(
+            caches.match(request).then(cached => cached || fetch(request).then(response => {
+                if (response.ok) {
+                    storeResponse(request, response);
+                }
+                return response;
+            }))
+        );
+    } else if (url.pathname.startsWith('/static/') || request.mode === 'navigate') {
+        // Unversioned assets and pages: prefer fresh, fall back offline
+        event.respondWith(networkFirst(request));
+    }
+});